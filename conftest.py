@@ -0,0 +1,14 @@
+"""pytest configuration.
+
+test_digest.py is a manual command-line script (its test_* functions take
+CLI arguments and talk to OBS/YouTube), not part of the automated suite.
+"""
+
+import logging
+
+import main
+
+collect_ignore = ["test_digest.py"]
+
+# Importing main attaches a handler for the real jtf.log; keep test runs out of it
+main.file_handler.setLevel(logging.CRITICAL + 1)
@@ -18,35 +18,76 @@ from __future__ import annotations
 
 import os
 import sys
+import atexit
 import json
 import time
 import gzip
 import shutil
+import sqlite3
 import hashlib
+import importlib.util
 import logging
+import threading
 import re
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 import calendar
+import random
+import html
+import glob
+import base64
+import subprocess
 from datetime import datetime, timezone, timedelta
-from functools import wraps
+from collections import OrderedDict, deque
+from email.utils import formatdate
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps, lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from queue import Empty, SimpleQueue
 from pathlib import Path
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 import requests
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 import anthropic
-from elevenlabs import ElevenLabs
-from twilio.rest import Client as TwilioClient
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.parser import HTMLParser  # Optional: faster HTML parsing
+except ImportError:
+    HTMLParser = None
+
+# Optional: lxml as the C parser for the BeautifulSoup fallback (probed, not imported)
+BS4_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
 
 
 # =============================================================================
 # PYTHON 3.8 COMPATIBILITY
 # =============================================================================
 
+# ET.indent landed in Python 3.9; fall back to the manual walk before that
+_ET_INDENT = getattr(ET, "indent", None)
+
+
 def indent_xml(elem, level=0, space="  "):
-    """Add pretty-print indentation to XML (Python 3.8 compatible version of ET.indent)."""
+    """Add pretty-print indentation to XML in place.
+
+    Uses the stdlib ET.indent (3.9+) when available; the recursive walk below
+    is kept for older interpreters. Either way the root gets a trailing
+    newline so written files end cleanly.
+    """
+    if level == 0 and _ET_INDENT is not None:
+        _ET_INDENT(elem, space=space)
+        if len(elem) and (not elem.tail or not elem.tail.strip()):
+            elem.tail = "\n"
+        return
     i = "\n" + level * space
     if len(elem):
         if not elem.text or not elem.text.strip():
@@ -62,41 +103,29 @@ def indent_xml(elem, level=0, space="  "):
             elem.tail = i
 
 
-def clean_duplicate_namespaces(file_path):
-    """Remove duplicate namespace declarations from XML file.
-
-    ElementTree sometimes adds duplicate xmlns declarations when multiple
-    namespaces are used. This post-processes the file to remove duplicates.
-    """
-    import re
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Find the rss opening tag and clean up duplicates
-    def remove_dupe_attrs(match):
-        tag = match.group(0)
-        # Extract all attributes
-        attrs = re.findall(r'(\S+)="([^"]*)"', tag)
-        seen = set()
-        unique_attrs = []
-        for name, value in attrs:
-            if name not in seen:
-                seen.add(name)
-                unique_attrs.append(f'{name}="{value}"')
-        return f'<rss {" ".join(unique_attrs)}>'
-
-    content = re.sub(r'<rss[^>]+>', remove_dupe_attrs, content)
-
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-
-
 # =============================================================================
 # RETRY LOGIC WITH EXPONENTIAL BACKOFF
 # =============================================================================
 
+RETRY_MAX_DELAY = 60.0  # Upper bound for a single backoff sleep
+
+
+def _retry_after_seconds(exc):
+    """Seconds from a Retry-After header on the exception's HTTP response, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None  # Missing, or an HTTP-date we don't bother parsing
+
+
 def retry_with_backoff(max_retries=3, base_delay=1.0, retryable_exceptions=None):
-    """Retry failed API calls with exponential backoff.
+    """Retry failed API calls with exponential backoff and full jitter.
+
+    A Retry-After header on the failed response is honored as a minimum delay.
 
     Args:
         max_retries: Number of retry attempts (default 3)
@@ -116,8 +145,13 @@ def retry_with_backoff(max_retries=3, base_delay=1.0, retryable_exceptions=None)
                 except retryable_exceptions as e:
                     last_exception = e
                     if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)  # 1s, 2s, 4s
-                        log.warning(f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {e}. Retrying in {delay}s...")
+                        # Full jitter: anywhere up to 1s, 2s, 4s... so parallel
+                        # callers don't retry in lockstep
+                        delay = random.uniform(0, min(base_delay * (2 ** attempt), RETRY_MAX_DELAY))
+                        retry_after = _retry_after_seconds(e)
+                        if retry_after is not None:
+                            delay = max(delay, retry_after)
+                        log.warning(f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {e}. Retrying in {delay:.1f}s...")
                         time.sleep(delay)
                     else:
                         log.error(f"{func.__name__} failed after {max_retries + 1} attempts: {e}")
@@ -150,12 +184,50 @@ ARCHIVE_DIR.mkdir(exist_ok=True)
 with open(CONFIG_FILE) as f:
     CONFIG = json.load(f)
 
+# Source lookups by ID (avoid scanning CONFIG["sources"] on every call)
+SOURCES_BY_ID = {s["id"]: s for s in CONFIG["sources"]}
+SOURCE_HOLDERS = {
+    s["id"]: frozenset(h["name"] for h in s.get("institutional_holders", []))
+    for s in CONFIG["sources"]
+}
+# Lowercased source name -> ID (reversed so the first configured source wins)
+SOURCE_IDS_BY_NAME = {s["name"].lower(): s["id"] for s in reversed(CONFIG["sources"])}
+
 # Logging - with explicit flush for network mount compatibility
 class FlushingFileHandler(logging.FileHandler):
-    """FileHandler that flushes after every write for network mount sync."""
+    """FileHandler that flushes errors immediately for network mount sync.
+
+    Other records are flushed by LogQueueListener once its backlog drains.
+    """
     def emit(self, record):
         super().emit(record)
-        self.flush()
+        if record.levelno >= logging.ERROR:
+            self.flush()
+
+
+class LogQueueHandler(QueueHandler):
+    """QueueHandler for an in-process listener.
+
+    Freezes the message text but keeps exc_info, so each handler still
+    formats tracebacks itself (the stock prepare() folds them into msg).
+    """
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class LogQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry.
+
+    Bursts of records are written in one go; an idle logger is still fully
+    on disk moments after its last record.
+    """
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
 
 
 class ErrorCapturingHandler(logging.Handler):
@@ -164,24 +236,28 @@ class ErrorCapturingHandler(logging.Handler):
     def __init__(self, max_records=50):
         super().__init__(level=logging.WARNING)
         self.max_records = max_records
-        self.records = []
+        # (record.created, entry) pairs; oldest drop off automatically
+        self.records = deque(maxlen=max_records)
 
     def emit(self, record):
         entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "message": record.getMessage()
         }
-        self.records.append(entry)
-        # Keep only last N records
-        if len(self.records) > self.max_records:
-            self.records = self.records[-self.max_records:]
+        self.records.append((record.created, entry))
 
     def get_recent(self, count=10, max_age_hours=1):
         """Get recent errors, filtering out those older than max_age_hours."""
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-        recent = [r for r in self.records if datetime.fromisoformat(r['timestamp'].replace('Z', '+00:00')) > cutoff]
-        return recent[-count:]
+        cutoff = time.time() - max_age_hours * 3600
+        recent = []
+        with self.lock:  # emit() runs on the log listener thread
+            for created, entry in reversed(self.records):
+                if created <= cutoff or len(recent) >= count:
+                    break
+                recent.append(entry)
+        recent.reverse()
+        return recent
 
 
 # Global error handler for dashboard
@@ -195,15 +271,19 @@ log_format = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s', date
 # Console handler
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(log_format)
-log.addHandler(console_handler)
 
 # File handler with flush
 file_handler = FlushingFileHandler(BASE_DIR / "jtf.log")
 file_handler.setFormatter(log_format)
-log.addHandler(file_handler)
 
-# Error capturing handler for dashboard
-log.addHandler(error_handler)
+# Callers only enqueue records; console, file and dashboard error capture
+# run on the listener's thread so disk latency stays off the hot path
+_log_queue = SimpleQueue()
+log.addHandler(LogQueueHandler(_log_queue))
+log_listener = LogQueueListener(_log_queue, console_handler, file_handler, error_handler,
+                                respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 # Kill switch file
 KILL_SWITCH = Path("/tmp/jtf-stop")
@@ -251,15 +331,40 @@ ALERT_COOLDOWNS = {
 MONTHLY_BUDGET = 50.00  # $50/month donation goal
 
 
+# (day number, "YYYY-MM-DD", yesterday's "YYYY-MM-DD", days in month) for the
+# current UTC day; rebuilt by _utc_day() only when the date changes
+_utc_day_cache = (None, None, None, None)
+
+
+def _utc_day() -> tuple:
+    """Return the cached per-day tuple for the current UTC date."""
+    global _utc_day_cache
+    ts = time.time()
+    day = int(ts) // 86400  # UTC day number; no datetime needed on a hit
+    if _utc_day_cache[0] != day:
+        now = datetime.fromtimestamp(ts, timezone.utc)
+        prev = now - timedelta(days=1)
+        _utc_day_cache = (
+            day,
+            f"{now.year:04d}-{now.month:02d}-{now.day:02d}",
+            f"{prev.year:04d}-{prev.month:02d}-{prev.day:02d}",
+            calendar.monthrange(now.year, now.month)[1],
+        )
+    return _utc_day_cache
+
+
+def utc_today() -> str:
+    """Today's UTC date as YYYY-MM-DD."""
+    return _utc_day()[1]
+
+
 def get_daily_budget() -> float:
     """Calculate daily budget based on days in current month.
 
     February: $50/28 = $1.79/day
     March: $50/31 = $1.61/day
     """
-    today = datetime.now(timezone.utc)
-    days_in_month = calendar.monthrange(today.year, today.month)[1]
-    return MONTHLY_BUDGET / days_in_month
+    return MONTHLY_BUDGET / _utc_day()[3]
 
 # Degraded service tracking
 _degraded_services = set()  # {"elevenlabs", "twilio"} when degraded
@@ -267,6 +372,89 @@ _degraded_services = set()  # {"elevenlabs", "twilio"} when degraded
 # Consecutive failure tracking for alerting
 _consecutive_failures = {"claude": 0, "elevenlabs": 0, "twilio": 0}
 
+# Shared Claude client (keeps TLS connections warm between calls)
+_anthropic_client = None
+
+
+def _get_anthropic():
+    """Return the shared Anthropic client, creating it on first use."""
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = anthropic.Anthropic(max_retries=2)
+    return _anthropic_client
+
+
+def _reset_anthropic():
+    """Drop the shared client so the next call opens a fresh connection pool."""
+    global _anthropic_client
+    _anthropic_client = None
+
+
+# Shared ElevenLabs client (SDK imported on first use)
+_elevenlabs_client = None
+
+
+def _get_elevenlabs():
+    """Return the shared ElevenLabs client, creating it on first use."""
+    global _elevenlabs_client
+    if _elevenlabs_client is None:
+        from elevenlabs import ElevenLabs
+        _elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+    return _elevenlabs_client
+
+
+# Shared Twilio client for SMS alerts (SDK imported on first use)
+_twilio_client = None
+
+
+def _get_twilio():
+    """Return the shared Twilio client, creating it on first use."""
+    global _twilio_client
+    if _twilio_client is None:
+        from twilio.rest import Client as TwilioClient
+        _twilio_client = TwilioClient(
+            os.getenv("TWILIO_ACCOUNT_SID"),
+            os.getenv("TWILIO_AUTH_TOKEN")
+        )
+    return _twilio_client
+
+
+def _json_loads(text):
+    """Parse JSON with orjson when installed, stdlib json otherwise.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    only need to catch the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Field extractors for malformed Claude JSON (compiled once, used per response)
+_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*(\{[^`]+\})\s*```', re.DOTALL)
+_CONTRADICTION_RE = re.compile(r'"contradiction"\s*:\s*(true|false)', re.IGNORECASE)
+_NEW_DETAIL_RE = re.compile(r'"new_detail"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+_REASON_RE = re.compile(r'"reason"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+_FACT_RE = re.compile(r'"fact"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+_CONFIDENCE_RE = re.compile(r'"confidence"\s*:\s*(\d+)')
+
+# Decodes the first JSON value at an offset and ignores whatever follows it
+_JSON_DECODER = json.JSONDecoder()
+# Tolerates raw control characters (newlines) inside regex-captured strings
+_JSON_STRING_DECODER = json.JSONDecoder(strict=False)
+
+
+def _unescape_json_string(raw: str) -> str:
+    """Decode the body of a JSON string literal captured by one of the field regexes.
+
+    Handles every JSON escape (\\n, \\\\, \\uXXXX, ...), not just \\". Falls back
+    to un-escaping quotes only if the captured text isn't a valid literal.
+    """
+    try:
+        return _JSON_STRING_DECODER.decode('"' + raw + '"')
+    except ValueError:
+        return raw.replace('\\"', '"')
+
 
 def safe_parse_claude_json(text: str, default: dict) -> dict:
     """Parse Claude response with fallback for malformed JSON.
@@ -280,19 +468,17 @@ def safe_parse_claude_json(text: str, default: dict) -> dict:
     if not text:
         return default
 
-    # Strategy 1: Extract JSON object from text
-    try:
-        start = text.find('{')
-        end = text.rfind('}') + 1
-        if start >= 0 and end > start:
-            return json.loads(text[start:end])
-    except json.JSONDecodeError:
-        pass
+    # Strategy 1: Decode the JSON object starting at the first brace
+    start = text.find('{')
+    if start >= 0:
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            pass
 
     # Strategy 2: Extract from markdown code blocks
     try:
-        import re
-        code_match = re.search(r'```(?:json)?\s*(\{[^`]+\})\s*```', text, re.DOTALL)
+        code_match = _CODEBLOCK_RE.search(text)
         if code_match:
             return json.loads(code_match.group(1))
     except json.JSONDecodeError:
@@ -300,21 +486,23 @@ def safe_parse_claude_json(text: str, default: dict) -> dict:
 
     # Strategy 3: Regex extraction of common fields
     result = dict(default)  # Copy default
+    if not any(key in text for key in ('"contradiction"', '"new_detail"', '"reason"')):
+        return result  # None of the fields are there to extract
 
     # Try to extract "contradiction" field
-    contradiction_match = re.search(r'"contradiction"\s*:\s*(true|false)', text, re.IGNORECASE)
+    contradiction_match = _CONTRADICTION_RE.search(text)
     if contradiction_match:
         result["contradiction"] = contradiction_match.group(1).lower() == "true"
 
     # Try to extract "new_detail" field
-    detail_match = re.search(r'"new_detail"\s*:\s*"([^"]*(?:\\.[^"]*)*)"', text)
+    detail_match = _NEW_DETAIL_RE.search(text)
     if detail_match:
-        result["new_detail"] = detail_match.group(1).replace('\\"', '"')
+        result["new_detail"] = _unescape_json_string(detail_match.group(1))
 
     # Try to extract "reason" field
-    reason_match = re.search(r'"reason"\s*:\s*"([^"]*(?:\\.[^"]*)*)"', text)
+    reason_match = _REASON_RE.search(text)
     if reason_match:
-        result["reason"] = reason_match.group(1).replace('\\"', '"')
+        result["reason"] = _unescape_json_string(reason_match.group(1))
 
     return result
 
@@ -368,7 +556,7 @@ def validate_services() -> bool:
 
     # Test Claude API with minimal call
     try:
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=10,
@@ -389,7 +577,7 @@ def validate_services() -> bool:
     # Test ElevenLabs if not already degraded
     if "elevenlabs" not in _degraded_services:
         try:
-            eleven_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+            _get_elevenlabs()
             # Just verify the key works - don't generate audio
             # The client will raise if key is invalid on first use
             log.info("ElevenLabs API: OK (key present)")
@@ -411,18 +599,20 @@ def track_api_failure(service: str, success: bool):
 
     Sends alert after 3 consecutive failures.
     """
-    global _consecutive_failures
-
     if success:
-        _consecutive_failures[service] = 0
+        if _consecutive_failures.get(service):
+            _consecutive_failures[service] = 0
         return
 
-    _consecutive_failures[service] = _consecutive_failures.get(service, 0) + 1
+    failures = _consecutive_failures.get(service, 0) + 1
 
-    if _consecutive_failures[service] >= 3:
+    if failures >= 3:
         if should_send_alert("api_failure"):
-            send_alert(f"{service} API failed {_consecutive_failures[service]} times", "api_failure")
-        _consecutive_failures[service] = 0  # Reset after alert
+            # Queued: the caller is mid-failure and shouldn't also wait on Twilio
+            send_alert_async(f"{service} API failed {failures} times", "api_failure")
+        failures = 0  # Reset after alert
+
+    _consecutive_failures[service] = failures
 
 
 def check_budget_alert(total_cost: float):
@@ -434,81 +624,121 @@ def check_budget_alert(total_cost: float):
             send_alert(f"API costs at ${total_cost:.2f} ({pct:.0f}% of ${daily_budget:.2f} budget)", "credits_low")
 
 
-def log_api_usage(service: str, usage: dict):
-    """Log API usage and costs to daily file.
+_api_usage_lock = threading.Lock()  # Guards _api_usage_pending; callers may be threads
+
+# Write-behind state: calls not yet written, kept as per-day deltas. A flush
+# (at most every API_USAGE_FLUSH_SECONDS, at the end of each cycle and at
+# exit) re-reads api_usage_<date>.json and adds the deltas to it, so other
+# processes logging usage (digest.sh, backfill_podcasts.py) keep their totals
+API_USAGE_FLUSH_SECONDS = 30
+_api_usage_pending = {}  # date -> {service: {"calls", "cost_usd", "details"}}
+_api_usage_flushed = 0.0  # time.monotonic() of the last write
 
-    Args:
-        service: "claude", "elevenlabs", or "twilio"
-        usage: Dict with service-specific usage data:
-            - claude: {"input_tokens": N, "output_tokens": N}
-            - elevenlabs: {"characters": N}
-            - twilio: {"sms_count": N}
-    """
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    usage_file = DATA_DIR / f"api_usage_{today}.json"
 
-    # Load existing usage
-    data = {"date": today, "services": {}, "total_cost_usd": 0.0}
+def _load_api_usage(date: str) -> dict:
+    """Read one day's usage totals from disk."""
+    usage_file = DATA_DIR / f"api_usage_{date}.json"
     if usage_file.exists():
         try:
-            with open(usage_file) as f:
-                data = json.load(f)
+            return _read_json(usage_file)
         except (json.JSONDecodeError, IOError):
             pass
+    return {"date": date, "services": {}, "total_cost_usd": 0.0}
 
-    # Initialize service if not present
-    if service not in data["services"]:
-        data["services"][service] = {"calls": 0, "cost_usd": 0.0, "details": {}}
 
-    svc = data["services"][service]
-    svc["calls"] += 1
+def _merge_api_usage(data: dict, services: dict) -> dict:
+    """Add per-service usage deltas to a day's totals."""
+    for service, delta in services.items():
+        svc = data["services"].setdefault(service, {"calls": 0, "cost_usd": 0.0, "details": {}})
+        svc["calls"] += delta["calls"]
+        svc["cost_usd"] += delta["cost_usd"]
+        for key, count in delta["details"].items():
+            svc["details"][key] = svc["details"].get(key, 0) + count
+    data["total_cost_usd"] = sum(s["cost_usd"] for s in data["services"].values())
+    return data
 
-    # Calculate cost based on service type
-    cost = 0.0
-    if service == "claude":
-        input_tokens = usage.get("input_tokens", 0)
-        output_tokens = usage.get("output_tokens", 0)
-        cost = (input_tokens / 1000 * API_COSTS["claude"]["input_per_1k"] +
-                output_tokens / 1000 * API_COSTS["claude"]["output_per_1k"])
-        svc["details"]["input_tokens"] = svc["details"].get("input_tokens", 0) + input_tokens
-        svc["details"]["output_tokens"] = svc["details"].get("output_tokens", 0) + output_tokens
 
-    elif service == "elevenlabs":
-        chars = usage.get("characters", 0)
-        cost = chars * API_COSTS["elevenlabs"]["per_character"]
-        svc["details"]["characters"] = svc["details"].get("characters", 0) + chars
+def _flush_api_usage_locked():
+    """Merge the pending usage deltas into their days' files (lock held)."""
+    global _api_usage_flushed
+    for date, services in list(_api_usage_pending.items()):
+        try:
+            data = _merge_api_usage(_load_api_usage(date), services)
+            _write_json(DATA_DIR / f"api_usage_{date}.json", data, fsync=True)
+            del _api_usage_pending[date]
+        except IOError as e:
+            log.warning(f"Could not save API usage: {e}")
+    _api_usage_flushed = time.monotonic()
 
-    elif service == "twilio":
-        count = usage.get("sms_count", 1)
-        cost = count * API_COSTS["twilio"]["per_sms"]
-        svc["details"]["sms_count"] = svc["details"].get("sms_count", 0) + count
 
-    svc["cost_usd"] += cost
+def flush_api_usage():
+    """Write pending API usage totals to disk."""
+    with _api_usage_lock:
+        _flush_api_usage_locked()
 
-    # Update total
-    data["total_cost_usd"] = sum(s["cost_usd"] for s in data["services"].values())
 
-    # Save back
-    try:
-        with open(usage_file, 'w') as f:
-            json.dump(data, f, indent=2)
-    except IOError as e:
-        log.warning(f"Could not save API usage: {e}")
+atexit.register(flush_api_usage)
 
 
-def get_api_costs_today() -> dict:
-    """Get today's API costs summary."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    usage_file = DATA_DIR / f"api_usage_{today}.json"
+def log_api_usage(service: str, usage: dict):
+    """Log API usage and costs to the daily totals (written by flush_api_usage).
 
-    if usage_file.exists():
-        try:
-            with open(usage_file) as f:
-                return json.load(f)
-        except:
-            pass
+    Args:
+        service: "claude", "elevenlabs", or "twilio"
+        usage: Dict with service-specific usage data:
+            - claude: {"input_tokens": N, "output_tokens": N}
+              (optionally "cache_read_input_tokens"/"cache_creation_input_tokens")
+            - elevenlabs: {"characters": N}
+            - twilio: {"sms_count": N}
+    """
+    with _api_usage_lock:
+        today = utc_today()
+        services = _api_usage_pending.setdefault(today, {})
+
+        # Initialize service if not present
+        if service not in services:
+            services[service] = {"calls": 0, "cost_usd": 0.0, "details": {}}
+
+        svc = services[service]
+        svc["calls"] += 1
+
+        # Calculate cost based on service type
+        cost = 0.0
+        if service == "claude":
+            input_tokens = usage.get("input_tokens", 0)
+            output_tokens = usage.get("output_tokens", 0)
+            # Prompt cache reads bill at 10% of input, cache writes at 125%
+            cache_read = usage.get("cache_read_input_tokens") or 0
+            cache_write = usage.get("cache_creation_input_tokens") or 0
+            cost = ((input_tokens + cache_read * 0.1 + cache_write * 1.25) / 1000 * API_COSTS["claude"]["input_per_1k"] +
+                    output_tokens / 1000 * API_COSTS["claude"]["output_per_1k"])
+            if cache_read:
+                svc["details"]["cache_read_tokens"] = svc["details"].get("cache_read_tokens", 0) + cache_read
+            svc["details"]["input_tokens"] = svc["details"].get("input_tokens", 0) + input_tokens
+            svc["details"]["output_tokens"] = svc["details"].get("output_tokens", 0) + output_tokens
+
+        elif service == "elevenlabs":
+            chars = usage.get("characters", 0)
+            cost = chars * API_COSTS["elevenlabs"]["per_character"]
+            svc["details"]["characters"] = svc["details"].get("characters", 0) + chars
+
+        elif service == "twilio":
+            count = usage.get("sms_count", 1)
+            cost = count * API_COSTS["twilio"]["per_sms"]
+            svc["details"]["sms_count"] = svc["details"].get("sms_count", 0) + count
+
+        svc["cost_usd"] += cost
+
+        # Persist at most every API_USAGE_FLUSH_SECONDS
+        if time.monotonic() - _api_usage_flushed >= API_USAGE_FLUSH_SECONDS:
+            _flush_api_usage_locked()
 
-    return {"date": today, "services": {}, "total_cost_usd": 0.0}
+
+def get_api_costs_today() -> dict:
+    """Get today's API costs summary (including not-yet-flushed usage)."""
+    today = utc_today()
+    with _api_usage_lock:
+        return _merge_api_usage(_load_api_usage(today), _api_usage_pending.get(today, {}))
 
 
 # =============================================================================
@@ -518,13 +748,18 @@ def get_api_costs_today() -> dict:
 DAILY_COSTS_FILE = DATA_DIR / "daily_costs.json"
 UPTIME_STATS_FILE = DATA_DIR / "uptime_stats.json"
 
+# Uptime stats are kept in memory between heartbeats and written every
+# UPTIME_SAVE_EVERY heartbeats (plus on startup, month rollover and exit)
+UPTIME_SAVE_EVERY = 10
+_uptime_stats = None
+_uptime_heartbeats = 0
+
 
 def load_daily_costs() -> dict:
     """Load rolling 30-day cost history."""
     if DAILY_COSTS_FILE.exists():
         try:
-            with open(DAILY_COSTS_FILE) as f:
-                return json.load(f)
+            return _read_json(DAILY_COSTS_FILE)
         except (json.JSONDecodeError, IOError):
             pass
     return {"days": [], "last_updated": None}
@@ -539,8 +774,7 @@ def save_daily_costs(data: dict):
     data["last_updated"] = datetime.now(timezone.utc).isoformat()
 
     try:
-        with open(DAILY_COSTS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(DAILY_COSTS_FILE, data, fsync=True)
     except IOError as e:
         log.warning(f"Could not save daily costs: {e}")
 
@@ -550,7 +784,8 @@ def archive_yesterday_cost():
 
     Called on startup or at midnight to record completed day's cost.
     """
-    yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+    yesterday = _utc_day()[2]
+    flush_api_usage()  # Yesterday's last calls may still be in memory
     yesterday_file = DATA_DIR / f"api_usage_{yesterday}.json"
 
     if not yesterday_file.exists():
@@ -558,8 +793,7 @@ def archive_yesterday_cost():
 
     # Load yesterday's total
     try:
-        with open(yesterday_file) as f:
-            yesterday_data = json.load(f)
+        yesterday_data = _read_json(yesterday_file)
     except (json.JSONDecodeError, IOError):
         return
 
@@ -596,8 +830,7 @@ def get_month_estimate() -> float:
     today_cost = today_data.get("total_cost_usd", 0)
 
     # Calculate days in current month
-    now = datetime.now(timezone.utc)
-    days_in_month = calendar.monthrange(now.year, now.month)[1]
+    days_in_month = _utc_day()[3]
 
     if not history["days"]:
         # No history - use today's cost as floor
@@ -616,8 +849,7 @@ def load_uptime_stats() -> dict:
     """Load monthly uptime tracking stats."""
     if UPTIME_STATS_FILE.exists():
         try:
-            with open(UPTIME_STATS_FILE) as f:
-                return json.load(f)
+            return _read_json(UPTIME_STATS_FILE)
         except (json.JSONDecodeError, IOError):
             pass
     return {
@@ -632,13 +864,41 @@ def load_uptime_stats() -> dict:
 
 def save_uptime_stats(stats: dict):
     """Save uptime stats to file."""
+    global _uptime_stats, _uptime_heartbeats
+    _uptime_stats = stats
+    _uptime_heartbeats = 0
     try:
-        with open(UPTIME_STATS_FILE, 'w') as f:
-            json.dump(stats, f, indent=2)
+        _write_json(UPTIME_STATS_FILE, stats, fsync=True)
     except IOError as e:
         log.warning(f"Could not save uptime stats: {e}")
 
 
+def flush_uptime_stats():
+    """Write uptime stats if heartbeats have accumulated since the last save."""
+    if _uptime_stats is not None and _uptime_heartbeats:
+        save_uptime_stats(_uptime_stats)
+
+
+atexit.register(flush_uptime_stats)
+
+
+def _last_heartbeat_ts(stats: dict) -> float | None:
+    """Unix time of the last heartbeat.
+
+    Uses the stored last_heartbeat_ts; stats saved before it existed fall
+    back to parsing the ISO last_heartbeat string.
+    """
+    ts = stats.get("last_heartbeat_ts")
+    if ts is not None:
+        return ts
+    if stats.get("last_heartbeat"):
+        try:
+            return datetime.fromisoformat(stats["last_heartbeat"].replace('Z', '+00:00')).timestamp()
+        except (ValueError, TypeError):
+            pass
+    return None
+
+
 def init_uptime_tracking():
     """Initialize uptime tracking on startup.
 
@@ -659,21 +919,20 @@ def init_uptime_tracking():
             "total_elapsed_seconds": 0,
             "availability_pct": 0,
             "last_heartbeat": now.isoformat(),
+            "last_heartbeat_ts": now.timestamp(),
             "session_start": now.isoformat()
         }
     else:
         # Same month - account for downtime
-        if stats["last_heartbeat"]:
-            try:
-                last_hb = datetime.fromisoformat(stats["last_heartbeat"].replace('Z', '+00:00'))
-                downtime = (now - last_hb).total_seconds()
-                stats["total_elapsed_seconds"] += downtime
-                log.info(f"Resuming uptime tracking - {downtime:.0f}s downtime recorded")
-            except (ValueError, TypeError):
-                pass
+        last_ts = _last_heartbeat_ts(stats)
+        if last_ts is not None:
+            downtime = now.timestamp() - last_ts
+            stats["total_elapsed_seconds"] += downtime
+            log.info(f"Resuming uptime tracking - {downtime:.0f}s downtime recorded")
 
         stats["session_start"] = now.isoformat()
         stats["last_heartbeat"] = now.isoformat()
+        stats["last_heartbeat_ts"] = now.timestamp()
 
     save_uptime_stats(stats)
     return stats
@@ -685,10 +944,13 @@ def update_uptime_tracking() -> dict:
     Adds time since last heartbeat to running totals.
     Returns current stats for display.
     """
+    global _uptime_stats, _uptime_heartbeats
     now = datetime.now(timezone.utc)
-    current_month = now.strftime("%Y-%m")
+    current_month = utc_today()[:7]
 
-    stats = load_uptime_stats()
+    if _uptime_stats is None:
+        _uptime_stats = load_uptime_stats()
+    stats = _uptime_stats
 
     # Check for month rollover
     if stats["month"] != current_month:
@@ -696,19 +958,18 @@ def update_uptime_tracking() -> dict:
         return stats
 
     # Calculate time since last heartbeat
-    if stats["last_heartbeat"]:
-        try:
-            last_hb = datetime.fromisoformat(stats["last_heartbeat"].replace('Z', '+00:00'))
-            elapsed = (now - last_hb).total_seconds()
+    now_ts = now.timestamp()
+    last_ts = _last_heartbeat_ts(stats)
+    if last_ts is not None:
+        elapsed = now_ts - last_ts
 
-            # Cap at 5 minutes - anything longer suggests a restart (handled by init)
-            if elapsed <= 300:
-                stats["total_running_seconds"] += elapsed
-                stats["total_elapsed_seconds"] += elapsed
-        except (ValueError, TypeError):
-            pass
+        # Cap at 5 minutes - anything longer suggests a restart (handled by init)
+        if elapsed <= 300:
+            stats["total_running_seconds"] += elapsed
+            stats["total_elapsed_seconds"] += elapsed
 
     stats["last_heartbeat"] = now.isoformat()
+    stats["last_heartbeat_ts"] = now_ts
 
     # Calculate availability
     if stats["total_elapsed_seconds"] > 0:
@@ -716,7 +977,9 @@ def update_uptime_tracking() -> dict:
             (stats["total_running_seconds"] / stats["total_elapsed_seconds"]) * 100, 1
         )
 
-    save_uptime_stats(stats)
+    _uptime_heartbeats += 1
+    if _uptime_heartbeats >= UPTIME_SAVE_EVERY:
+        save_uptime_stats(stats)
     return stats
 
 
@@ -793,35 +1056,51 @@ Return a JSON object with:
 Headline to process:
 """
 
+# Headline variant: lets Claude answer rejects with a short object instead of
+# a full rewrite (journalist submissions keep the full answer, see
+# extract_fact's keep_rejected)
+FACT_EXTRACTION_PROMPT_SHORT_REJECT = FACT_EXTRACTION_PROMPT.replace(
+    "Headline to process:",
+    'If "newsworthy" is false, stop there and return only '
+    '{"newsworthy": false, "threshold_met": "none", "fact": "SKIP", "confidence": 0}\n\n'
+    "Headline to process:"
+)
+# Rejection probe, checked before any JSON decoding
+_NOT_NEWSWORTHY_RE = re.compile(r'"newsworthy"\s*:\s*false', re.IGNORECASE)
+
 
 @retry_with_backoff(max_retries=3, base_delay=1.0, retryable_exceptions=(
     ConnectionError, TimeoutError, OSError,
     anthropic.APITimeoutError, anthropic.APIConnectionError,
     anthropic.RateLimitError, anthropic.InternalServerError
 ))
-def extract_fact(headline: str, use_cache: bool = True) -> dict:
+def extract_fact(headline: str, use_cache: bool = True, keep_rejected: bool = False) -> dict:
     """Send headline to Claude for fact extraction.
 
-    Uses cached result if available to reduce API costs.
+    Uses cached result if available to reduce API costs. Not-newsworthy
+    answers come back as SKIP (newsworthy=False) without being decoded,
+    unless keep_rejected is set, in which case the full answer (with the
+    cleaned fact) is returned. Rejects are never cached.
     """
     headline_hash = get_story_hash(headline)
 
     # Check cache first (saves ~$0.001 per cached hit)
     if use_cache:
-        cached = _fact_extraction_cache.get(headline_hash)
+        cached = lookup_fact_extraction(headline_hash)
         if cached:
             log.debug(f"Cache hit for headline: {headline[:50]}...")
             return cached
 
     try:
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
 
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=CONFIG["claude"]["max_tokens"],
             messages=[{
                 "role": "user",
-                "content": FACT_EXTRACTION_PROMPT + headline
+                "content": (FACT_EXTRACTION_PROMPT if keep_rejected
+                            else FACT_EXTRACTION_PROMPT_SHORT_REJECT) + headline
             }]
         )
 
@@ -833,31 +1112,41 @@ def extract_fact(headline: str, use_cache: bool = True) -> dict:
 
         text = response.content[0].text
 
-        # Try standard JSON parsing first
-        try:
-            start = text.find('{')
-            end = text.rfind('}') + 1
-            if start >= 0 and end > start:
-                result = json.loads(text[start:end])
-                save_fact_extraction(headline_hash, result)
+        # Cheap rejection: nothing in a not-newsworthy answer is used
+        not_newsworthy = _NOT_NEWSWORTHY_RE.search(text) is not None
+        if not_newsworthy and not keep_rejected:
+            return {"fact": "SKIP", "confidence": 0, "removed": [], "newsworthy": False}
+
+        # Try standard JSON parsing first (object starting at the first brace)
+        start = text.find('{')
+        if start >= 0:
+            try:
+                result = _JSON_DECODER.raw_decode(text, start)[0]
+                if result.get("fact") != "SKIP" and result.get("newsworthy", True):
+                    save_fact_extraction(headline_hash, result)
                 return result
-        except json.JSONDecodeError:
-            pass
+            except json.JSONDecodeError:
+                pass
 
         # Fallback: Extract fields using regex (handles malformed JSON)
-        fact_match = re.search(r'"fact"\s*:\s*"([^"]*(?:\\.[^"]*)*)"', text)
-        conf_match = re.search(r'"confidence"\s*:\s*(\d+)', text)
+        fact_match = _FACT_RE.search(text)
+        conf_match = _CONFIDENCE_RE.search(text)
 
         if fact_match:
-            fact = fact_match.group(1).replace('\\"', '"')
+            fact = _unescape_json_string(fact_match.group(1))
             confidence = int(conf_match.group(1)) if conf_match else 85
             result = {"fact": fact, "confidence": confidence, "removed": []}
-            save_fact_extraction(headline_hash, result)
+            if not_newsworthy:
+                result["newsworthy"] = False
+            elif fact != "SKIP":
+                save_fact_extraction(headline_hash, result)
             return result
 
         return {"fact": "SKIP", "confidence": 0, "removed": []}
 
     except Exception as e:
+        if isinstance(e, anthropic.APIConnectionError):
+            _reset_anthropic()
         log.error(f"Claude API error: {e}")
         return {"fact": "SKIP", "confidence": 0, "removed": [], "error": str(e)}
 
@@ -866,57 +1155,117 @@ def extract_fact(headline: str, use_cache: bool = True) -> dict:
 # JUDGE LOOKUP - Enhance facts with full judge name and court
 # =============================================================================
 
-# Patterns that indicate incomplete judge references
-INCOMPLETE_JUDGE_PATTERNS = [
-    r'\b[Aa] federal judge\b',
-    r'\b[Aa] judge\b',
-    r'\b[Tt]he judge\b',
-    r'\bJudge [A-Z][a-z]+\b(?! of)',  # "Judge Smith" without "of [Court]"
-    r'\b[Ff]ederal court\b(?! for)',   # "federal court" without location
-]
+# Incomplete judge references, as one alternation behind a shared \b so the
+# fact is scanned once
+INCOMPLETE_JUDGE_PATTERN = (
+    r'\b(?:'
+    r'[Aa] (?:federal )?judge\b'       # "a judge", "a federal judge"
+    r'|[Tt]he judge\b'
+    r'|Judge [A-Z][a-z]+\b(?! of)'     # "Judge Smith" without "of [Court]"
+    r'|[Ff]ederal court\b(?! for)'     # "federal court" without location
+    r')'
+)
 
 # Pattern to detect complete judge references (no lookup needed)
 COMPLETE_JUDGE_PATTERN = r'Judge [A-Z][a-z]+ [A-Z][a-z]+ of (the |)[A-Z]'
 
+# Compiled once at import (checked for every extracted fact)
+_INCOMPLETE_JUDGE_RE = re.compile(INCOMPLETE_JUDGE_PATTERN)
+_COMPLETE_JUDGE_RE = re.compile(COMPLETE_JUDGE_PATTERN)
+_LOCATION_RE = re.compile(r'in ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
+# The flat {"found": ...} object in a judge lookup reply; skips any other
+# braces Claude puts in the surrounding prose
+_JUDGE_JSON_RE = re.compile(r'\{[^{}]*"found"\s*:\s*(?:true|false)[^{}]*\}')
+
+# Case-topic keywords (lowercase) -> search term for judge lookups
+JUDGE_TOPIC_KEYWORDS = {
+    "immigration": "immigration",
+    "abortion": "abortion",
+    "gun": "gun",
+    "firearm": "gun",
+    "trump": "trump",
+    "biden": "biden",
+}
+# All topic keywords in one case-insensitive scan of the fact
+_JUDGE_TOPIC_RE = re.compile("|".join(map(re.escape, JUDGE_TOPIC_KEYWORDS)), re.IGNORECASE)
+
+# Incomplete references replaced by enhance_fact_with_judge, in priority order
+_JUDGE_REPLACE_RES = (
+    re.compile(r'\b[Aa] federal judge\b'),
+    re.compile(r'\b[Aa] judge\b'),
+    re.compile(r'\b[Tt]he judge\b'),
+    re.compile(r'\bJudge [A-Z][a-z]+\b(?! of)'),
+)
+
 
 def needs_judge_lookup(fact: str) -> bool:
     """Check if fact mentions a judge without full name/court details."""
-    # First check if it has a complete reference already
-    if re.search(COMPLETE_JUDGE_PATTERN, fact):
-        return False
+    # Complete references need no lookup; otherwise any incomplete pattern does
+    return _COMPLETE_JUDGE_RE.search(fact) is None and _INCOMPLETE_JUDGE_RE.search(fact) is not None
 
-    # Check for incomplete patterns
-    for pattern in INCOMPLETE_JUDGE_PATTERNS:
-        if re.search(pattern, fact):
-            return True
 
-    return False
+# Judge lookup cache: fact+headline hash -> {"result": dict|None, "cached_at": epoch}
+JUDGE_CACHE_FILE = DATA_DIR / "judge_cache.json"
+JUDGE_CACHE_TTL = 24 * 3600  # 24 hours
+_judge_cache: dict | None = None  # Loaded from disk on first lookup
+
+
+def load_judge_cache() -> dict:
+    """Load unexpired judge lookups from disk."""
+    if not JUDGE_CACHE_FILE.exists():
+        return {}
+    try:
+        cache = _read_json(JUDGE_CACHE_FILE)
+    except (json.JSONDecodeError, IOError):
+        return {}
+    cutoff = time.time() - JUDGE_CACHE_TTL
+    return {k: v for k, v in cache.items() if v.get("cached_at", 0) > cutoff}
+
+
+_judge_cache_lock = threading.Lock()
+
+
+def save_judge_lookup(key: str, result: dict | None):
+    """Cache a judge lookup result (including 'not found') and persist it."""
+    with _judge_cache_lock:
+        _judge_cache[key] = {"result": result, "cached_at": time.time()}
+        try:
+            _write_json(JUDGE_CACHE_FILE, _judge_cache)
+        except IOError as e:
+            log.warning(f"Could not save judge cache: {e}")
 
 
 def search_judge_info(fact: str, original_headline: str) -> dict | None:
     """Search for judge information using web search.
 
+    Results are cached for 24 hours by fact + headline, so a story that
+    recurs across cycles doesn't repeat the web search and Claude call.
+
     Returns dict with 'full_name' and 'court' if found, None otherwise.
     """
+    global _judge_cache
+    if _judge_cache is None:
+        _judge_cache = load_judge_cache()
+
+    cache_key = f"{get_story_hash(fact)}:{get_story_hash(original_headline)}"
+    cached = _judge_cache.get(cache_key)
+    if cached and cached["cached_at"] > time.time() - JUDGE_CACHE_TTL:
+        log.debug(f"Judge cache hit for: {fact[:50]}...")
+        return cached["result"]
+
     try:
         # Build search query from the fact
         # Extract key terms that might help identify the judge
         search_terms = []
 
         # Look for case-related terms
-        if 'immigration' in fact.lower():
-            search_terms.append('immigration')
-        if 'abortion' in fact.lower():
-            search_terms.append('abortion')
-        if 'gun' in fact.lower() or 'firearm' in fact.lower():
-            search_terms.append('gun')
-        if 'trump' in fact.lower():
-            search_terms.append('trump')
-        if 'biden' in fact.lower():
-            search_terms.append('biden')
+        found = {m.group(0).lower() for m in _JUDGE_TOPIC_RE.finditer(fact)}
+        for keyword, term in JUDGE_TOPIC_KEYWORDS.items():
+            if keyword in found and term not in search_terms:
+                search_terms.append(term)
 
         # Look for location hints
-        location_match = re.search(r'in ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', fact)
+        location_match = _LOCATION_RE.search(fact)
         if location_match:
             search_terms.append(location_match.group(1))
 
@@ -929,18 +1278,17 @@ def search_judge_info(fact: str, original_headline: str) -> dict | None:
         }
 
         search_url = f"https://html.duckduckgo.com/html/?q={requests.utils.quote(query)}"
-        response = requests.get(search_url, headers=headers, timeout=10)
+        response = _get_http_session().get(search_url, headers=headers, timeout=10)
 
         if response.status_code != 200:
             log.debug(f"Judge search failed: HTTP {response.status_code}")
             return None
 
         # Parse search results
-        soup = BeautifulSoup(response.text, 'html.parser')
-        results_text = soup.get_text()[:3000]  # First 3000 chars of results
+        results_text = html_to_text(response.text, 3000)  # First 3000 chars of results
 
         # Use Claude to extract judge info from search results
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
 
         prompt = f"""From these search results, extract the judge's information for this news story.
 
@@ -976,19 +1324,23 @@ If you cannot determine the specific judge, return {{"found": false}}"""
 
         # Parse JSON from response
         try:
-            start = result_text.find('{')
-            end = result_text.rfind('}') + 1
-            if start >= 0 and end > start:
-                result = json.loads(result_text[start:end])
+            json_match = _JUDGE_JSON_RE.search(result_text)
+            if json_match:
+                result = _json_loads(json_match.group(0))
                 if result.get("found") and result.get("full_name") and result.get("court"):
                     log.info(f"Found judge: {result['full_name']} of {result['court']}")
+                    save_judge_lookup(cache_key, result)
                     return result
         except json.JSONDecodeError:
             pass
 
+        # Claude answered but found no judge - cache that too
+        save_judge_lookup(cache_key, None)
         return None
 
     except Exception as e:
+        if isinstance(e, anthropic.APIConnectionError):
+            _reset_anthropic()
         log.debug(f"Judge search error: {e}")
         return None
 
@@ -1001,21 +1353,13 @@ def enhance_fact_with_judge(fact: str, judge_info: dict) -> str:
     # Build the replacement text
     replacement = f"Judge {full_name} of the {court}"
 
-    # Replace various incomplete patterns
-    replacements = [
-        (r'\b[Aa] federal judge\b', replacement),
-        (r'\b[Aa] judge\b', replacement),
-        (r'\b[Tt]he judge\b', replacement),
-        (r'\bJudge ([A-Z][a-z]+)\b(?! of)', f"Judge {full_name} of the {court}"),
-    ]
-
-    enhanced = fact
-    for pattern, repl in replacements:
-        enhanced = re.sub(pattern, repl, enhanced, count=1)
-        if enhanced != fact:
-            break  # Only replace first match
-
-    return enhanced
+    # Replace one reference, trying patterns in priority order (callable:
+    # names are literal text)
+    for pattern in _JUDGE_REPLACE_RES:
+        enhanced, count = pattern.subn(lambda m: replacement, fact, count=1)
+        if count:
+            return enhanced
+    return fact
 
 
 # =============================================================================
@@ -1026,7 +1370,163 @@ def enhance_fact_with_judge(fact: str, judge_info: dict) -> str:
 _robots_cache = {}  # domain -> (RobotFileParser, timestamp)
 ROBOTS_CACHE_TTL = 3600  # 1 hour
 
+# Raw robots.txt responses behind _robots_cache, saved so a restart within
+# the TTL reuses them instead of re-fetching every domain
+ROBOTS_CACHE_FILE = DATA_DIR / "robots_cache.json"
+_robots_responses = {}  # domain -> {"fetched_at", "status", "text"}
+_robots_dirty = False  # Set once this process has fetched a robots.txt
+
 USER_AGENT = "JTFNews/1.0"
+SCRAPE_WORKERS = 8  # Concurrent source fetches per cycle
+
+# Shared HTTP session: keeps connections to news sites alive across requests
+# and cycles instead of a new TCP+TLS handshake per fetch
+_http_session = None
+
+
+def _get_http_session() -> requests.Session:
+    """Return the shared scraping session, creating it on first use."""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        # Retry dropped/reset connections at the transport level only;
+        # HTTP error statuses are still returned to the caller untouched
+        retries = Retry(total=2, connect=2, read=2, status=0, backoff_factor=0.3)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=SCRAPE_WORKERS,
+                                                max_retries=retries)
+        _http_session.mount("http://", adapter)
+        _http_session.mount("https://", adapter)
+    return _http_session
+
+
+HTML_PARSE_LIMIT = 200_000  # Chars of a page parsed when only its leading text is used
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def html_to_text(html_text: str, limit: int) -> str:
+    """Return the first limit chars of a page's visible text.
+
+    Uses selectolax when installed; otherwise strips tags with regexes
+    rather than building a full BeautifulSoup tree.
+    """
+    html_text = html_text[:HTML_PARSE_LIMIT]
+    if HTMLParser is not None:
+        tree = HTMLParser(html_text)
+        tree.strip_tags(["script", "style"])
+        return tree.text()[:limit]
+    text = _TAG_RE.sub('', _SCRIPT_STYLE_RE.sub('', html_text))
+    return html.unescape(text)[:limit]
+
+
+def _robots_parser(domain: str, status: int | None, text: str) -> RobotFileParser:
+    """Build a parser from a robots.txt response (status None = fetch failed)."""
+    parser = RobotFileParser()
+    parser.set_url(f"{domain}/robots.txt")
+    # Same rules as RobotFileParser.read()
+    if status is None:
+        parser.allow_all = True  # If robots.txt errors, assume allowed
+    elif status in (401, 403):
+        parser.disallow_all = True
+    elif status >= 400:
+        parser.allow_all = True
+    else:
+        parser.parse(text.splitlines())
+    return parser
+
+
+def fetch_robots(domain: str) -> RobotFileParser:
+    """Fetch and parse robots.txt for a domain ("scheme://host") and cache it."""
+    global _robots_dirty
+    robots_url = f"{domain}/robots.txt"
+    status, text = None, ""
+    try:
+        # Over the shared session rather than RobotFileParser.read()
+        response = _get_http_session().get(
+            robots_url, headers={"User-Agent": USER_AGENT}, timeout=10
+        )
+        status = response.status_code
+        if status < 400:
+            text = response.text
+    except Exception as e:
+        log.debug(f"No robots.txt for {domain}: {e}")
+
+    parser = _robots_parser(domain, status, text)
+
+    # Cache it
+    fetched_at = time.time()
+    _robots_cache[domain] = (parser, fetched_at)
+    _robots_responses[domain] = {"fetched_at": fetched_at, "status": status, "text": text}
+    _robots_dirty = True
+    return parser
+
+
+def load_robots_cache():
+    """Restore unexpired robots.txt responses saved by save_robots_cache()."""
+    try:
+        saved = _read_json(ROBOTS_CACHE_FILE)
+    except (OSError, ValueError):
+        return
+    cutoff = time.time() - ROBOTS_CACHE_TTL
+    for domain, entry in saved.items():
+        if entry["fetched_at"] > cutoff and domain not in _robots_cache:
+            parser = _robots_parser(domain, entry["status"], entry["text"])
+            _robots_cache[domain] = (parser, entry["fetched_at"])
+            _robots_responses[domain] = entry
+
+
+def save_robots_cache():
+    """Write the cached robots.txt responses to disk if any were fetched.
+
+    Processes that import main without scraping (digest.sh, setup scripts,
+    tests) leave the daemon's saved file alone.
+    """
+    global _robots_dirty
+    if not _robots_dirty:
+        return
+    try:
+        _write_json(ROBOTS_CACHE_FILE, dict(_robots_responses))
+        _robots_dirty = False
+    except OSError as e:
+        log.warning(f"Could not save robots.txt cache: {e}")
+
+
+atexit.register(save_robots_cache)
+
+
+def prefetch_robots():
+    """Fetch robots.txt for all configured sources in parallel.
+
+    Domains still fresh in the cache (e.g. restored by load_robots_cache)
+    are skipped. Reschedules itself shortly before the oldest entry's TTL
+    runs out, so can_fetch_url() stays a cache hit in the scrape path.
+    """
+    refresh_in = ROBOTS_CACHE_TTL - 60
+    try:
+        domains = set()
+        for source in CONFIG["sources"]:
+            if source.get("url"):
+                parsed = urlparse(source["url"])
+                domains.add(f"{parsed.scheme}://{parsed.netloc}")
+
+        # Anything expiring before the next run is fetched now
+        now = time.time()
+        stale = [d for d in domains
+                 if d not in _robots_cache or now - _robots_cache[d][1] > ROBOTS_CACHE_TTL - 120]
+        if stale:
+            with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+                list(executor.map(fetch_robots, stale))
+            save_robots_cache()
+        log.debug(f"Prefetched robots.txt for {len(stale)} of {len(domains)} domains")
+
+        oldest = min((_robots_cache[d][1] for d in domains if d in _robots_cache), default=now)
+        refresh_in = max(60, oldest + ROBOTS_CACHE_TTL - 60 - time.time())
+    except Exception as e:
+        log.warning(f"robots.txt prefetch failed: {e}")
+    finally:
+        timer = threading.Timer(refresh_in, prefetch_robots)
+        timer.daemon = True
+        timer.start()
 
 
 def can_fetch_url(url: str) -> bool:
@@ -1034,33 +1534,18 @@ def can_fetch_url(url: str) -> bool:
     try:
         parsed = urlparse(url)
         domain = f"{parsed.scheme}://{parsed.netloc}"
-        robots_url = f"{domain}/robots.txt"
-
-        now = time.time()
 
-        # Check cache
+        # Check cache (normally primed by prefetch_robots)
         if domain in _robots_cache:
             parser, cached_time = _robots_cache[domain]
-            if now - cached_time < ROBOTS_CACHE_TTL:
+            if time.time() - cached_time < ROBOTS_CACHE_TTL:
                 allowed = parser.can_fetch(USER_AGENT, url)
                 if not allowed:
                     log.debug(f"robots.txt blocks: {url}")
                 return allowed
 
-        # Fetch and parse robots.txt
-        parser = RobotFileParser()
-        parser.set_url(robots_url)
-        try:
-            parser.read()
-        except Exception as e:
-            # If robots.txt doesn't exist or errors, assume allowed
-            log.debug(f"No robots.txt for {domain}: {e}")
-            # Create permissive parser
-            parser = RobotFileParser()
-            parser.allow_all = True
-
-        # Cache it
-        _robots_cache[domain] = (parser, now)
+        # Unknown or expired domain - fetch now
+        parser = fetch_robots(domain)
 
         allowed = parser.can_fetch(USER_AGENT, url)
         if not allowed:
@@ -1085,33 +1570,41 @@ def fetch_rss_headlines(source: dict) -> list:
             "User-Agent": f"{USER_AGENT} (Facts only, no opinions; RSS reader)"
         }
 
-        response = requests.get(rss_url, headers=headers, timeout=15)
-        response.raise_for_status()
+        # Stream the feed and stop after the first 10 items, rather than
+        # downloading and building a tree for the whole document
+        with _get_http_session().get(rss_url, headers=headers, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+
+            fetched_at = datetime.now(timezone.utc).isoformat()
+            item_count = 0
+            for _, elem in ET.iterparse(response.raw, events=('end',)):
+                # RSS feeds have item elements, Atom feeds have entry elements
+                if elem.tag not in ('item', '{http://www.w3.org/2005/Atom}entry'):
+                    continue
 
-        # Parse RSS XML
-        root = ET.fromstring(response.content)
-
-        # RSS feeds have items under channel, Atom feeds have entry elements
-        items = root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry')
-
-        for item in items[:10]:  # Limit to first 10 headlines
-            # Try RSS format first, then Atom format
-            title = item.find('title')
-            if title is None:
-                title = item.find('{http://www.w3.org/2005/Atom}title')
-
-            if title is not None and title.text:
-                text = title.text.strip()
-                if len(text) > 20:  # Skip very short items
-                    headlines.append({
-                        "text": text,
-                        "source_id": source["id"],
-                        "source_name": source["name"],
-                        "source_rating": source["ratings"]["accuracy"],
-                        "owner": source["owner"],
-                        "source_url": source["url"],
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
+                # Try RSS format first, then Atom format
+                title = elem.find('title')
+                if title is None:
+                    title = elem.find('{http://www.w3.org/2005/Atom}title')
+
+                if title is not None and title.text:
+                    text = title.text.strip()
+                    if len(text) > 20:  # Skip very short items
+                        headlines.append({
+                            "text": text,
+                            "source_id": source["id"],
+                            "source_name": source["name"],
+                            "source_rating": source["ratings"]["accuracy"],
+                            "owner": source["owner"],
+                            "source_url": source["url"],
+                            "timestamp": fetched_at
+                        })
+
+                elem.clear()  # Free the parsed item
+                item_count += 1
+                if item_count >= 10:  # Limit to first 10 headlines
+                    break
 
         if headlines:
             log.info(f"Fetched {len(headlines)} headlines from {source['name']} (RSS)")
@@ -1142,16 +1635,20 @@ def fetch_html_headlines(source: dict) -> list:
             "Connection": "keep-alive",
         }
 
-        response = requests.get(source["url"], headers=headers, timeout=15, allow_redirects=True)
+        response = _get_http_session().get(source["url"], headers=headers, timeout=15, allow_redirects=True)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
         # Find headlines using configured selector
-        elements = soup.select(source["scrape_selector"])
+        if HTMLParser is not None:
+            elements = HTMLParser(response.text).css(source["scrape_selector"])
+            texts = [el.text(strip=True) for el in elements[:10]]
+        else:
+            soup = BeautifulSoup(response.text, BS4_PARSER)
+            elements = soup.select(source["scrape_selector"], limit=10)  # Stop matching at 10
+            texts = [el.get_text(strip=True) for el in elements]
 
-        for el in elements[:10]:  # Limit to first 10 headlines
-            text = el.get_text(strip=True)
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        for text in texts:  # Limit to first 10 headlines
             if text and len(text) > 20:  # Skip very short items
                 headlines.append({
                     "text": text,
@@ -1160,7 +1657,7 @@ def fetch_html_headlines(source: dict) -> list:
                     "source_rating": source["ratings"]["accuracy"],
                     "owner": source["owner"],
                     "source_url": source["url"],
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": fetched_at
                 })
 
         if headlines:
@@ -1172,26 +1669,50 @@ def fetch_html_headlines(source: dict) -> list:
     return headlines
 
 
+# Parallel scraping: sources are fetched concurrently, but requests to the
+# same domain stay at least DOMAIN_MIN_INTERVAL seconds apart
+DOMAIN_MIN_INTERVAL = 1.0
+_domain_locks = {}  # domain -> threading.Lock
+_domain_last_request = {}  # domain -> time of last request
+_domain_locks_guard = threading.Lock()
+
+
+def wait_for_domain(url: str):
+    """Block until it's polite to send another request to url's domain."""
+    domain = urlparse(url).netloc
+    with _domain_locks_guard:
+        lock = _domain_locks.setdefault(domain, threading.Lock())
+
+    with lock:
+        wait = _domain_last_request.get(domain, 0) + DOMAIN_MIN_INTERVAL - time.time()
+        if wait > 0:
+            time.sleep(wait)
+        _domain_last_request[domain] = time.time()
+
+
 def fetch_headlines(source: dict) -> list:
     """Fetch headlines from a news source. Tries RSS first, falls back to HTML."""
     # Try RSS first (more reliable, designed for machine consumption)
+    if source.get("rss"):
+        wait_for_domain(source["rss"])
     headlines = fetch_rss_headlines(source)
 
     # Fall back to HTML scraping if RSS didn't work
     if not headlines:
+        wait_for_domain(source["url"])
         headlines = fetch_html_headlines(source)
 
     return headlines
 
 
 def scrape_all_sources() -> list:
-    """Scrape headlines from all configured sources."""
+    """Scrape headlines from all configured sources (in parallel)."""
     all_headlines = []
 
-    for source in CONFIG["sources"]:
-        headlines = fetch_headlines(source)
-        all_headlines.extend(headlines)
-        time.sleep(1)  # Be polite between requests
+    # map() keeps results in config order
+    with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+        for headlines in executor.map(fetch_headlines, CONFIG["sources"]):
+            all_headlines.extend(headlines)
 
     return all_headlines
 
@@ -1201,7 +1722,12 @@ def scrape_all_sources() -> list:
 # =============================================================================
 
 def get_story_hash(text: str) -> str:
-    """Generate hash of story text for deduplication."""
+    """Generate hash of story text for deduplication (12 hex chars).
+
+    Kept as MD5: these hashes are persisted (shown/processed stores, fact
+    and judge cache keys, audit fact_hash, audio filenames), so changing
+    the scheme would orphan everything already recorded for the day.
+    """
     return hashlib.md5(text.lower().encode()).hexdigest()[:12]
 
 
@@ -1229,9 +1755,7 @@ def load_journalists() -> dict:
     """Load journalist profiles from data/journalists.json."""
     journalists_file = DATA_DIR / "journalists.json"
     if journalists_file.exists():
-        with open(journalists_file) as f:
-            data = json.load(f)
-        return data.get("journalists", {})
+        return _read_json(journalists_file).get("journalists", {})
     return {}
 
 
@@ -1242,8 +1766,7 @@ def save_journalists(journalists: dict):
         "journalists": journalists,
         "last_updated": datetime.now(timezone.utc).isoformat()
     }
-    with open(journalists_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_json(journalists_file, data)
 
 
 def get_journalist_info(journalist_id: str) -> dict:
@@ -1376,11 +1899,7 @@ def get_source_info(source_id: str) -> dict:
         return None
 
     # Institutional source from config.json
-    for source in CONFIG["sources"]:
-        if source["id"] == source_id:
-            return source
-
-    return None
+    return SOURCES_BY_ID.get(source_id)
 
 
 def are_sources_unrelated(source1_id: str, source2_id: str) -> bool:
@@ -1402,9 +1921,13 @@ def are_sources_unrelated(source1_id: str, source2_id: str) -> bool:
     if s1["owner"] == s2["owner"]:
         return False
 
-    # Check institutional holder overlap
-    holders1 = {h["name"] for h in s1.get("institutional_holders", [])}
-    holders2 = {h["name"] for h in s2.get("institutional_holders", [])}
+    # Check institutional holder overlap (precomputed for config sources)
+    holders1 = SOURCE_HOLDERS.get(source1_id)
+    if holders1 is None:
+        holders1 = {h["name"] for h in s1.get("institutional_holders", [])}
+    holders2 = SOURCE_HOLDERS.get(source2_id)
+    if holders2 is None:
+        holders2 = {h["name"] for h in s2.get("institutional_holders", [])}
 
     shared = holders1 & holders2
     if len(shared) >= CONFIG["unrelated_rules"]["max_shared_top_holders"]:
@@ -1413,23 +1936,108 @@ def are_sources_unrelated(source1_id: str, source2_id: str) -> bool:
     return True
 
 
-def has_word_overlap(fact1: str, fact2: str, threshold: float = 0.15) -> bool:
+def fact_words(fact: str) -> frozenset:
+    """Extract meaningful words (3+ chars, lowercase) for overlap checks."""
+    return frozenset(w for w in fact.lower().split() if len(w) >= 3)
+
+
+def queue_item_words(item: dict) -> frozenset:
+    """Word set for a queue item, computed once and kept on the item.
+
+    Stored under "_words" (in memory only - save_queue drops it).
+    """
+    words = item.get("_words")
+    if words is None:
+        words = item["_words"] = fact_words(item["fact"])
+    return words
+
+
+# Word sets for published facts, reused across duplicate checks
+_published_words: dict = {}
+
+
+def published_fact_words(fact: str) -> frozenset:
+    """Word set for a published fact, memoized by fact text."""
+    words = _published_words.get(fact)
+    if words is None:
+        if len(_published_words) > 2000:  # Bound memory across days
+            _published_words.clear()
+        words = _published_words[fact] = fact_words(fact)
+    return words
+
+
+def has_word_overlap(fact1, fact2, threshold: float = 0.15) -> bool:
     """Quick check if two facts share enough words to possibly be related.
 
+    Each argument is a fact string or a precomputed fact_words() set.
     Returns True if at least threshold% of words overlap.
     This is a cheap pre-filter before calling Claude.
     """
-    # Extract meaningful words (3+ chars, lowercase)
-    words1 = set(w.lower() for w in fact1.split() if len(w) >= 3)
-    words2 = set(w.lower() for w in fact2.split() if len(w) >= 3)
+    words1 = fact1 if isinstance(fact1, frozenset) else fact_words(fact1)
+    words2 = fact2 if isinstance(fact2, frozenset) else fact_words(fact2)
 
     if not words1 or not words2:
         return False
 
-    shared = words1 & words2
-    min_len = min(len(words1), len(words2))
+    needed = min(len(words1), len(words2)) * threshold
+    if words1.isdisjoint(words2):
+        return needed <= 0
+    return len(words1 & words2) >= needed
+
+
+def word_jaccard(words1: frozenset, words2: frozenset) -> float:
+    """Jaccard similarity of two fact_words() sets (0.0 - 1.0)."""
+    if not words1 or not words2:
+        return 0.0
+    shared = len(words1 & words2)
+    return shared / (len(words1) + len(words2) - shared)
+
+
+# Word-overlap brackets around the Claude match call. A single candidate
+# this similar is accepted outright; candidates all below the reject bound
+# are dropped. Both paths are logged so the bounds can be tuned.
+MATCH_EARLY_ACCEPT_JACCARD = 0.6
+MATCH_EARLY_REJECT_JACCARD = 0.2
+
+
+def early_match_decision(fact: str, new_words: frozenset, candidates: list):
+    """Decide a match without Claude when word overlap is conclusive.
+
+    Returns the list of matches (possibly empty) when decided,
+    or None if Claude should be asked.
+    """
+    scores = [word_jaccard(new_words, queue_item_words(item)) for item in candidates]
+    if len(candidates) == 1 and scores[0] >= MATCH_EARLY_ACCEPT_JACCARD:
+        log.info(f"Early match accept (jaccard={scores[0]:.2f}): '{fact[:40]}...'")
+        return candidates
+    if max(scores) < MATCH_EARLY_REJECT_JACCARD:
+        log.info(f"Early match reject (max jaccard={max(scores):.2f}, "
+                 f"{len(candidates)} candidates): '{fact[:40]}...'")
+        return []
+    return None
+
+
+# Fixed instructions for the story-matching calls. Kept separate from the
+# per-call text so Anthropic prompt caching can reuse the prefix.
+MATCH_STORIES_PREAMBLE = """Compare the new fact (given last) against the numbered list of existing facts.
+Return ONLY the numbers of facts that describe the SAME EVENT as the new fact.
+Same event means: same incident, same person doing same action, same announcement.
+Details like death counts or exact wording may differ."""
+
+DUPLICATE_CHECK_PREAMBLE = """Does the new fact (given last) describe the SAME EVENT as any fact in the published list?
+Same event means: same incident, same person doing same action, same announcement.
+Details like death counts or exact wording may differ."""
+
 
-    return len(shared) >= min_len * threshold
+def claude_usage(response) -> dict:
+    """Extract token usage (including prompt cache tokens) for log_api_usage."""
+    usage = response.usage
+    return {
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0),
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0),
+    }
 
 
 def find_matching_stories(fact: str, queue: list) -> list:
@@ -1441,42 +2049,40 @@ def find_matching_stories(fact: str, queue: list) -> list:
         return []
 
     # Pre-filter: only check items with some word overlap (saves API calls)
-    candidates = [item for item in queue if has_word_overlap(fact, item["fact"])]
+    new_words = fact_words(fact)
+    candidates = [item for item in queue if has_word_overlap(new_words, queue_item_words(item))]
 
     if not candidates:
         return []
 
     log.info(f"Word overlap pre-filter: {len(candidates)}/{len(queue)} candidates")
 
+    decided = early_match_decision(fact, new_words, candidates)
+    if decided is not None:
+        return decided
+
     try:
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
 
         # Build numbered list of candidate facts
         queue_list = "\n".join([f"{i+1}. {item['fact']}" for i, item in enumerate(candidates)])
 
-        prompt = f"""Compare this new fact against the numbered list below.
-Return ONLY the numbers of facts that describe the SAME EVENT as the new fact.
-Same event means: same incident, same person doing same action, same announcement.
-Details like death counts or exact wording may differ.
-
-New fact: {fact}
-
-Existing facts:
-{queue_list}
-
-Reply with ONLY comma-separated numbers (e.g., "1,3,5") or "NONE" if no matches."""
-
+        # Only the static rubric is a cacheable prefix: the candidate list
+        # is filtered per fact, so it rarely repeats between calls
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=50,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": [
+                {"type": "text", "text": MATCH_STORIES_PREAMBLE,
+                 "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": f"Existing facts:\n{queue_list}"},
+                {"type": "text", "text": f"New fact: {fact}\n\n"
+                 "Reply with ONLY comma-separated numbers (e.g., \"1,3,5\") or \"NONE\" if no matches."},
+            ]}]
         )
 
         # Log API usage for cost tracking
-        log_api_usage("claude", {
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens
-        })
+        log_api_usage("claude", claude_usage(response))
 
         answer = response.content[0].text.strip().upper()
 
@@ -1496,88 +2102,396 @@ Reply with ONLY comma-separated numbers (e.g., "1,3,5") or "NONE" if no matches.
         return matches
 
     except Exception as e:
+        if isinstance(e, anthropic.APIConnectionError):
+            _reset_anthropic()
         log.error(f"Claude batch matching error: {e}")
         return []
 
 
+MATCH_STORIES_MULTI_PREAMBLE = """Compare each numbered NEW fact against the numbered list of EXISTING facts.
+For each new fact, list the numbers of existing facts that describe the SAME EVENT.
+Same event means: same incident, same person doing same action, same announcement.
+Details like death counts or exact wording may differ."""
+
+
+def find_matching_stories_multi(facts: list, queue: list) -> dict:
+    """Find queue matches for several new facts with one Claude call.
+
+    Each fact is pre-filtered with word overlap as in find_matching_stories,
+    and only its own candidates are accepted from the answer.
+
+    Returns:
+        Dict mapping index in facts -> list of matching queue items
+        (facts with no matches are omitted)
+    """
+    if not facts or not queue:
+        return {}
+
+    # Pre-filter each fact against the queue (saves tokens and false matches)
+    per_fact = {}
+    results = {}
+    for i, fact in enumerate(facts):
+        new_words = fact_words(fact)
+        cands = [item for item in queue if has_word_overlap(new_words, queue_item_words(item))]
+        if not cands:
+            continue
+        decided = early_match_decision(fact, new_words, cands)
+        if decided is None:
+            per_fact[i] = cands
+        elif decided:
+            results[i] = decided
+
+    if not per_fact:
+        return results
+
+    # Union of candidates, numbered once for the prompt
+    candidates = []
+    cand_index = {}
+    for cands in per_fact.values():
+        for item in cands:
+            if id(item) not in cand_index:
+                cand_index[id(item)] = len(candidates)
+                candidates.append(item)
+
+    log.info(f"Word overlap pre-filter: {len(per_fact)}/{len(facts)} new facts, "
+             f"{len(candidates)}/{len(queue)} candidates")
+
+    fact_nums = list(per_fact)  # Prompt number n -> index in facts
+    new_list = "\n".join(f"{n+1}. {facts[i]}" for n, i in enumerate(fact_nums))
+    queue_list = "\n".join(f"{i+1}. {item['fact']}" for i, item in enumerate(candidates))
+
+    try:
+        client = _get_anthropic()
+
+        response = client.messages.create(
+            model=CONFIG["claude"]["model"],
+            max_tokens=30 + 20 * len(fact_nums),
+            messages=[{"role": "user", "content": [
+                {"type": "text", "text": MATCH_STORIES_MULTI_PREAMBLE,
+                 "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": f"EXISTING facts:\n{queue_list}"},
+                {"type": "text", "text": f"NEW facts:\n{new_list}\n\n"
+                 "Reply with ONLY a JSON object mapping each new fact number to a list of "
+                 "existing fact numbers, e.g. {\"1\": [3, 5], \"2\": []}"},
+            ]}]
+        )
+
+        # Log API usage for cost tracking
+        log_api_usage("claude", claude_usage(response))
+
+        text = response.content[0].text
+        start = text.find('{')
+        end = text.rfind('}') + 1
+        if start < 0 or end <= start:
+            return results
+        answer = _json_loads(text[start:end])
+
+        for key, nums in answer.items():
+            try:
+                n = int(key) - 1  # Convert to 0-indexed
+            except ValueError:
+                continue
+            if not 0 <= n < len(fact_nums) or not isinstance(nums, list):
+                continue
+            fact_idx = fact_nums[n]
+            allowed = {id(item) for item in per_fact[fact_idx]}
+            matches = []
+            for num in nums:
+                try:
+                    c = int(num) - 1
+                except (ValueError, TypeError):
+                    continue
+                if 0 <= c < len(candidates) and id(candidates[c]) in allowed:
+                    item = candidates[c]
+                    if all(item is not m for m in matches):
+                        matches.append(item)
+            if matches:
+                results[fact_idx] = matches
+
+        return results
+
+    except Exception as e:
+        if isinstance(e, anthropic.APIConnectionError):
+            _reset_anthropic()
+        log.error(f"Claude batch matching error: {e}")
+        return results
+
+
+# Near-duplicate cache: MinHash signatures of facts Claude already judged
+# duplicates today. A new fact whose estimated Jaccard similarity (word
+# 3-grams) to a cached one is >= DUP_CACHE_THRESHOLD is a duplicate without
+# another API call. Only YES answers are cached - published stories only
+# grow during the day, so a NO may go stale.
+#
+# Lookups go through an LSH index: each signature is split into
+# MINHASH_BANDS bands and bucketed by band. Only entries sharing a bucket
+# are compared in full, so a lookup costs O(bands) instead of a scan.
+MINHASH_PERMUTATIONS = 128
+MINHASH_BANDS = 32  # 4 rows per band: ~99% recall at Jaccard 0.6
+DUP_CACHE_THRESHOLD = 0.6
+DUP_CACHE_MAX = 1000
+_MINHASH_PRIME = (1 << 61) - 1
+_minhash_rng = random.Random(1)  # Fixed seed: signatures stay comparable
+_MINHASH_PARAMS = [
+    (_minhash_rng.randrange(1, _MINHASH_PRIME), _minhash_rng.randrange(0, _MINHASH_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+_MINHASH_ROWS = MINHASH_PERMUTATIONS // MINHASH_BANDS
+_dup_cache: OrderedDict = OrderedDict()  # story hash -> signature (LRU order)
+_dup_lsh: dict = {}  # (band, band values) -> set of story hashes
+_dup_cache_date = None
+
+
+def minhash_signature(text: str) -> tuple:
+    """Compute a MinHash signature over lowercase word 3-grams."""
+    words = text.lower().split()
+    shingles = {" ".join(words[i:i + 3]) for i in range(max(1, len(words) - 2))}
+    hashes = [int.from_bytes(hashlib.blake2b(sh.encode(), digest_size=8).digest(), "big")
+              for sh in shingles]
+    return tuple(min((a * h + b) % _MINHASH_PRIME for h in hashes) for a, b in _MINHASH_PARAMS)
+
+
+def _lsh_bands(signature: tuple):
+    """Yield the LSH bucket keys for a signature."""
+    for band in range(MINHASH_BANDS):
+        start = band * _MINHASH_ROWS
+        yield (band, signature[start:start + _MINHASH_ROWS])
+
+
+def _check_dup_cache(signature: tuple) -> bool:
+    """Return True if signature is near a fact already judged a duplicate today."""
+    global _dup_cache_date
+    today = utc_today()
+    if _dup_cache_date != today:
+        _dup_cache.clear()
+        _dup_lsh.clear()
+        _dup_cache_date = today
+        return False
+
+    # Candidates share at least one band; confirm with the full signature
+    candidates = set()
+    for bucket in _lsh_bands(signature):
+        candidates.update(_dup_lsh.get(bucket, ()))
+
+    for key in candidates:
+        cached_sig = _dup_cache[key]
+        same = sum(1 for x, y in zip(signature, cached_sig) if x == y)
+        if same >= DUP_CACHE_THRESHOLD * MINHASH_PERMUTATIONS:
+            _dup_cache.move_to_end(key)
+            return True
+    return False
+
+
+def _remember_duplicate(fact: str, signature: tuple):
+    """Add a confirmed duplicate to the near-duplicate cache."""
+    key = get_story_hash(fact)
+    if key in _dup_cache:
+        _dup_cache.move_to_end(key)
+        return
+    _dup_cache[key] = signature
+    for bucket in _lsh_bands(signature):
+        _dup_lsh.setdefault(bucket, set()).add(key)
+
+    if len(_dup_cache) > DUP_CACHE_MAX:
+        old_key, old_sig = _dup_cache.popitem(last=False)
+        for bucket in _lsh_bands(old_sig):
+            keys = _dup_lsh.get(bucket)
+            if keys is not None:
+                keys.discard(old_key)
+                if not keys:
+                    del _dup_lsh[bucket]
+
+
 def is_duplicate_batch(fact: str, published: list) -> bool:
     """Check if fact matches any published story using a single Claude call."""
     if not published:
         return False
 
+    # Near-duplicate of a fact Claude already confirmed? Skip the API call.
+    signature = minhash_signature(fact)
+    if _check_dup_cache(signature):
+        log.info(f"Duplicate (MinHash cache): '{fact[:40]}...'")
+        return True
+
     # Pre-filter: only check stories with word overlap
-    candidates = [p for p in published if has_word_overlap(fact, p)]
+    new_words = fact_words(fact)
+    candidates = [p for p in published if has_word_overlap(new_words, published_fact_words(p))]
 
     if not candidates:
         return False  # No overlap = definitely not a duplicate
 
     try:
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
 
         # Build numbered list of candidate published facts
         pub_list = "\n".join([f"{i+1}. {p}" for i, p in enumerate(candidates)])
 
-        prompt = f"""Does this new fact describe the SAME EVENT as any fact in the list below?
-Same event means: same incident, same person doing same action, same announcement.
-Details like death counts or exact wording may differ.
-
-New fact: {fact}
-
-Published facts:
-{pub_list}
-
-Reply with ONLY "YES" or "NO"."""
-
+        # Static rubric first (cacheable prefix); the published list is
+        # filtered per fact, so it stays after the breakpoint
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=10,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": [
+                {"type": "text", "text": DUPLICATE_CHECK_PREAMBLE,
+                 "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": f"Published facts:\n{pub_list}"},
+                {"type": "text", "text": f"New fact: {fact}\n\nReply with ONLY \"YES\" or \"NO\"."},
+            ]}]
         )
 
         # Log API usage for cost tracking
-        log_api_usage("claude", {
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens
-        })
+        log_api_usage("claude", claude_usage(response))
 
         answer = response.content[0].text.strip().upper()
         if answer == "YES":
             log.info(f"Duplicate (Claude batch): '{fact[:40]}...'")
+            _remember_duplicate(fact, signature)
             return True
         return False
 
     except Exception as e:
+        if isinstance(e, anthropic.APIConnectionError):
+            _reset_anthropic()
         log.error(f"Claude duplicate check error: {e}")
         return False
 
 
+# =============================================================================
+# FILE CACHE (Skip re-reading data files that haven't changed on disk)
+# =============================================================================
+
+# path -> ((st_mtime_ns, st_size), parsed data)
+_file_cache: dict = {}
+
+
+def _file_key(path: Path):
+    """Return the (mtime, size) validator for path, or None if missing."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def cached_load(path: Path, parse):
+    """Return parse(path), re-parsing only when the file changes on disk.
+
+    Returns None if the file doesn't exist. Callers must not mutate the
+    returned object unless they save it back (see cache_store).
+    """
+    key = _file_key(path)
+    if key is None:
+        _file_cache.pop(path, None)
+        return None
+
+    cached = _file_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    data = parse(path)
+    _file_cache[path] = (key, data)
+    return data
+
+
+def cache_store(path: Path, data):
+    """Record data as the current parsed contents of path (after writing it)."""
+    key = _file_key(path)
+    if key is not None:
+        _file_cache[path] = (key, data)
+
+
+def _read_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _atomic_write(path: Path, content, fsync: bool = False):
+    """Replace path with content (str as UTF-8, or bytes) in one step.
+
+    Written to a temp file and renamed into place, so readers (and a
+    crash mid-write) never see a partial file. fsync=True also forces the
+    data to disk before the rename; use it on batched flushes, not per call.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _write_json(path: Path, data, fsync: bool = False):
+    """Atomically write data as indented JSON (orjson when installed)."""
+    if orjson is not None:
+        _atomic_write(path, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS), fsync)
+    else:
+        _atomic_write(path, json.dumps(data, indent=2), fsync)
+
+
 # =============================================================================
 # LEARNED RATINGS SYSTEM
 # =============================================================================
 
+# Write-behind state: ratings updates are kept in memory and written to
+# disk once per cycle by flush_ratings() (and at exit)
+_learned_ratings = None
+_ratings_dirty = False
+_audit_fp = None  # Ratings audit log, opened once and reused
+
+
 def load_learned_ratings() -> dict:
     """Load learned ratings from file. Returns dict of source_id -> stats."""
-    ratings_file = DATA_DIR / "learned_ratings.json"
-    if ratings_file.exists():
-        with open(ratings_file) as f:
-            return json.load(f)
-    return {}
+    if _ratings_dirty:
+        return _learned_ratings  # Unflushed updates are newer than the file
+    ratings = cached_load(DATA_DIR / "learned_ratings.json", _read_json)
+    return ratings if ratings is not None else {}
 
 
 def save_learned_ratings(ratings: dict):
-    """Save learned ratings to file."""
+    """Record updated learned ratings; written to disk by flush_ratings()."""
+    global _learned_ratings, _ratings_dirty
+    _learned_ratings = ratings
+    _ratings_dirty = True
+    _display_ratings.clear()  # Ratings may have been changed in place
+
+
+def _save_learned_ratings_now(ratings: dict):
+    """Write learned ratings to file."""
     ratings_file = DATA_DIR / "learned_ratings.json"
-    with open(ratings_file, 'w') as f:
-        json.dump(ratings, f, indent=2)
+    _write_json(ratings_file, ratings, fsync=True)
+    cache_store(ratings_file, ratings)
+
+
+def flush_ratings():
+    """Write pending learned ratings and audit log lines to disk."""
+    global _ratings_dirty
+    if _ratings_dirty:
+        _save_learned_ratings_now(_learned_ratings)
+        _ratings_dirty = False
+    if _audit_fp is not None:
+        _audit_fp.flush()
+
+
+atexit.register(flush_ratings)
 
 
 def append_audit_log(source_id: str, event: str, fact_hash: str, extra: dict = None):
     """Append audit entry to ratings audit trail. One JSON line per event.
 
     This creates a legally defensible record of all rating calculations.
-    Each line is an independent JSON object (JSONL format).
+    Each line is an independent JSON object (JSONL format). The file is
+    unbuffered, so every entry reaches the OS as soon as it's written.
     """
-    audit_file = DATA_DIR / "ratings_audit.jsonl"
+    _write_audit_lines([_audit_line(source_id, event, fact_hash, extra)])
+
+
+def _audit_line(source_id: str, event: str, fact_hash: str, extra: dict = None) -> bytes:
+    """Encode one audit entry as a JSONL line."""
     entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "source_id": source_id,
@@ -1585,8 +2499,17 @@ def append_audit_log(source_id: str, event: str, fact_hash: str, extra: dict = N
         "fact_hash": fact_hash,
         **(extra or {})
     }
-    with open(audit_file, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    if orjson is not None:
+        return orjson.dumps(entry) + b'\n'
+    return (json.dumps(entry) + '\n').encode()
+
+
+def _write_audit_lines(lines: list):
+    """Append encoded audit lines with a single write."""
+    global _audit_fp
+    if _audit_fp is None:
+        _audit_fp = open(DATA_DIR / "ratings_audit.jsonl", 'ab', buffering=0)
+    _audit_fp.write(b"".join(lines))
 
 
 def record_verification_success(source_id: str, fact_hash: str = None):
@@ -1624,35 +2547,57 @@ def record_verification_success(source_id: str, fact_hash: str = None):
 
 def record_verification_failure(source_id: str, fact_hash: str = None):
     """Record that a source's story expired without verification."""
-    ratings = load_learned_ratings()
+    record_verification_failures_bulk([(source_id, fact_hash)])
 
-    if source_id not in ratings:
-        ratings[source_id] = {"successes": 0, "failures": 0}
 
-    ratings[source_id]["failures"] += 1
-    save_learned_ratings(ratings)
+def record_verification_failures_bulk(entries: list):
+    """Record several expired stories at once: [(source_id, fact_hash), ...].
 
-    # Audit trail for legal defensibility
-    if fact_hash:
-        append_audit_log(source_id, "failure", fact_hash)
+    Same bookkeeping as record_verification_failure, but ratings and
+    journalists are loaded and saved once and the audit lines go out in
+    one write.
+    """
+    if not entries:
+        return
 
-    log.info(f"Rating +1 failure for {source_id}: {ratings[source_id]}")
+    ratings = load_learned_ratings()
+    journalists = None
+    journalists_changed = False
+    audit_lines = []
+
+    for source_id, fact_hash in entries:
+        if source_id not in ratings:
+            ratings[source_id] = {"successes": 0, "failures": 0}
+        ratings[source_id]["failures"] += 1
+
+        # Audit trail for legal defensibility
+        if fact_hash:
+            audit_lines.append(_audit_line(source_id, "failure", fact_hash))
+
+        log.info(f"Rating +1 failure for {source_id}: {ratings[source_id]}")
+
+        # If this is a journalist source, also update journalist stats
+        if source_id.startswith("journalist:"):
+            journalist_id = source_id.split(":", 1)[1]
+            if journalists is None:
+                journalists = load_journalists()
+            if journalist_id in journalists:
+                journalists[journalist_id]["stats"]["failures"] += 1
+                journalists[journalist_id]["stats"]["expired"] += 1
+                # Recalculate accuracy rating
+                stats = journalists[journalist_id]["stats"]
+                total = stats["successes"] + stats["failures"]
+                if total > 0:
+                    journalists[journalist_id]["ratings"]["accuracy"] = round(
+                        (stats["successes"] / total) * 10, 1
+                    )
+                journalists_changed = True
 
-    # If this is a journalist source, also update journalist stats
-    if source_id.startswith("journalist:"):
-        journalist_id = source_id.split(":", 1)[1]
-        journalists = load_journalists()
-        if journalist_id in journalists:
-            journalists[journalist_id]["stats"]["failures"] += 1
-            journalists[journalist_id]["stats"]["expired"] += 1
-            # Recalculate accuracy rating
-            stats = journalists[journalist_id]["stats"]
-            total = stats["successes"] + stats["failures"]
-            if total > 0:
-                journalists[journalist_id]["ratings"]["accuracy"] = round(
-                    (stats["successes"] / total) * 10, 1
-                )
-            save_journalists(journalists)
+    save_learned_ratings(ratings)
+    if audit_lines:
+        _write_audit_lines(audit_lines)
+    if journalists_changed:
+        save_journalists(journalists)
 
 
 def get_learned_rating(source_id: str) -> float:
@@ -1679,11 +2624,12 @@ def get_learned_rating(source_id: str) -> float:
 
     ratings = load_learned_ratings()
 
+    source = SOURCES_BY_ID.get(source_id)
+
     if source_id not in ratings:
         # Return default from config
-        for source in CONFIG["sources"]:
-            if source["id"] == source_id:
-                return source["ratings"]["accuracy"]
+        if source:
+            return source["ratings"]["accuracy"]
         return 5.0  # Fallback
 
     stats = ratings[source_id]
@@ -1691,13 +2637,12 @@ def get_learned_rating(source_id: str) -> float:
 
     if total < 5:
         # Not enough data yet, blend with default
-        for source in CONFIG["sources"]:
-            if source["id"] == source_id:
-                default = source["ratings"]["accuracy"]
-                learned = (stats["successes"] / total) * 10 if total > 0 else default
-                # Weight: more data = more weight on learned rating
-                weight = total / 5
-                return default * (1 - weight) + learned * weight
+        if source:
+            default = source["ratings"]["accuracy"]
+            learned = (stats["successes"] / total) * 10 if total > 0 else default
+            # Weight: more data = more weight on learned rating
+            weight = total / 5
+            return default * (1 - weight) + learned * weight
         return 5.0
 
     # Enough data, use learned rating
@@ -1805,7 +2750,7 @@ def check_journalist_quota(journalist_id: str) -> bool:
     # Count today's submissions
     submissions_dir = DATA_DIR / "submissions"
     processed_dir = submissions_dir / "processed"
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
     count = 0
 
     # Count pending submissions from today
@@ -2093,7 +3038,7 @@ def update_feedback_stats(triage_result: str):
         except Exception:
             data = {"daily": {}, "totals": {}}
 
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
 
     # Update daily counts
     if today not in data["daily"]:
@@ -2138,7 +3083,7 @@ Evidence URL: {feedback.get('evidence_url', 'none')}
 
 Respond with JSON only: {{"classification": "<category>"}}"""
 
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=CONFIG["claude"]["max_tokens"],
@@ -2179,8 +3124,7 @@ def verify_factual_error(feedback: dict) -> dict:
     story = None
     if stories_file.exists():
         try:
-            with open(stories_file) as f:
-                stories_data = json.load(f)
+            stories_data = _read_json(stories_file)
             for s in stories_data.get("stories", []):
                 if s.get("id") == story_id:
                     story = s
@@ -2214,7 +3158,7 @@ Respond with JSON only:
   "reason": "explanation of assessment"
 }}"""
 
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=CONFIG["claude"]["max_tokens"],
@@ -2396,8 +3340,7 @@ def process_pending_feedback():
                     stories_file = DATA_DIR / "stories.json"
                     if stories_file.exists():
                         try:
-                            with open(stories_file) as f:
-                                stories_data = json.load(f)
+                            stories_data = _read_json(stories_file)
                             for s in stories_data.get("stories", []):
                                 if s.get("id") == story_id:
                                     original_fact = s.get("fact", "")
@@ -2514,6 +3457,12 @@ def update_journalist_disclosure(journalist_id: str, financial_disclosures: list
     save_journalists(journalists)
 
 
+# Display strings by source ID, valid for one ratings snapshot. Cleared by
+# save_learned_ratings() and whenever learned_ratings.json is re-read.
+_display_ratings: dict = {}
+_display_ratings_of = None  # Ratings dict the cache was built from
+
+
 def get_display_rating(source_id: str) -> str:
     """Get rating with evidence indicator for display.
 
@@ -2522,14 +3471,26 @@ def get_display_rating(source_id: str) -> str:
     - 1-9 data points: "8.5* (3/10)" (cold start, showing evidence)
     - 10+ data points: "9.4 (47/50)" (mature, evidence-based)
     """
+    global _display_ratings_of
     ratings = load_learned_ratings()
+    if ratings is not _display_ratings_of:
+        _display_ratings.clear()
+        _display_ratings_of = ratings
+
+    display = _display_ratings.get(source_id)
+    if display is None:
+        display = _display_ratings[source_id] = _format_display_rating(source_id, ratings)
+    return display
+
+
+def _format_display_rating(source_id: str, ratings: dict) -> str:
+    """Build the get_display_rating() string from a ratings snapshot."""
 
     # Get default rating from config
     default_rating = 5.0
-    for source in CONFIG["sources"]:
-        if source["id"] == source_id:
-            default_rating = source["ratings"]["accuracy"]
-            break
+    source = SOURCES_BY_ID.get(source_id)
+    if source:
+        default_rating = source["ratings"]["accuracy"]
 
     if source_id not in ratings:
         # No data - show default with asterisk
@@ -2556,14 +3517,21 @@ def get_display_rating(source_id: str) -> str:
     return f"{rating:.1f} ({successes}/{total})"
 
 
-def get_compact_scores(source_id: str) -> str:
-    """Get compact Accuracy|Bias display for lower-third.
+# (display rating, accuracy part, bias score) by source ID. An entry is
+# reused while get_display_rating() still returns the same display string.
+_score_parts: dict = {}
 
-    Format: "9.8|9.5" or "9.8*|9.5" (asterisk if accuracy has limited data)
-    Accuracy is learned/blended, Bias is from config baseline.
+
+def get_score_parts(source_id: str) -> tuple:
+    """Accuracy part and 0-10 bias score shared by the lower-third and RSS views.
+
+    Returns (accuracy_part, bias_score), e.g. ("9.4", 9.5) or ("8.5*", 10.0).
     """
     # Get accuracy part (learned or baseline)
     accuracy_display = get_display_rating(source_id)
+    cached = _score_parts.get(source_id)
+    if cached and cached[0] == accuracy_display:
+        return cached[1], cached[2]
 
     # Extract just the number and asterisk (strip evidence counts)
     # e.g., "9.4 (47/50)" -> "9.4", "8.5* (3/10)" -> "8.5*", "9.6*" -> "9.6*"
@@ -2573,25 +3541,31 @@ def get_compact_scores(source_id: str) -> str:
     # Config stores bias on -2 to +2 scale (political leaning)
     # Convert to 0-10 scale where 10 = neutral, 0 = heavily biased
     raw_bias = 0.0
-    for source in CONFIG["sources"]:
-        if source["id"] == source_id:
-            raw_bias = source["ratings"].get("bias", 0.0)
-            break
+    source = SOURCES_BY_ID.get(source_id)
+    if source:
+        raw_bias = source["ratings"].get("bias", 0.0)
 
     # Convert: 0 → 10, ±2 → 0
     # Formula: 10 - (abs(bias) * 5), clamped to 0-10
     bias_score = max(0.0, min(10.0, 10.0 - (abs(raw_bias) * 5)))
 
+    _score_parts[source_id] = (accuracy_display, accuracy_part, bias_score)
+    return accuracy_part, bias_score
+
+
+def get_compact_scores(source_id: str) -> str:
+    """Get compact Accuracy|Bias display for lower-third.
+
+    Format: "9.8|9.5" or "9.8*|9.5" (asterisk if accuracy has limited data)
+    Accuracy is learned/blended, Bias is from config baseline.
+    """
+    accuracy_part, bias_score = get_score_parts(source_id)
     return f"{accuracy_part}|{bias_score:.1f}"
 
 
 def get_source_id_by_name(source_name: str) -> str:
     """Look up source ID from source name. Returns empty string if not found."""
-    name_lower = source_name.lower().strip()
-    for source in CONFIG["sources"]:
-        if source["name"].lower() == name_lower:
-            return source["id"]
-    return ""
+    return SOURCE_IDS_BY_NAME.get(source_name.lower().strip(), "")
 
 
 def get_source_for_rss(source_id: str) -> dict:
@@ -2622,23 +3596,14 @@ def get_source_for_rss(source_id: str) -> dict:
                 "speed": "0.0", "consensus": "0.0", "control_type": "journalist", "owners": []}
 
     # Find source in config
-    source_config = None
-    for source in CONFIG["sources"]:
-        if source["id"] == source_id:
-            source_config = source
-            break
+    source_config = SOURCES_BY_ID.get(source_id)
 
     if not source_config:
         return {"name": source_id, "url": "", "accuracy": "0.0", "bias": "0.0",
                 "speed": "0.0", "consensus": "0.0", "control_type": "unknown", "owners": []}
 
-    # Get learned accuracy (or baseline with asterisk indicator)
-    accuracy_display = get_display_rating(source_id)
-    accuracy_part = accuracy_display.split()[0]  # "9.4" or "8.5*"
-
-    # Get bias score (convert from -2/+2 scale to 0-10 where 10 = neutral)
-    raw_bias = source_config["ratings"].get("bias", 0.0)
-    bias_score = max(0.0, min(10.0, 10.0 - (abs(raw_bias) * 5)))
+    # Learned accuracy (or baseline with asterisk) and 0-10 bias score
+    accuracy_part, bias_score = get_score_parts(source_id)
 
     # Get speed and consensus from config
     speed = source_config["ratings"].get("speed", 5.0)
@@ -2677,18 +3642,17 @@ def get_source_for_rss(source_id: str) -> dict:
 
 def load_queue() -> list:
     """Load the story queue from file."""
-    queue_file = DATA_DIR / "queue.json"
-    if queue_file.exists():
-        with open(queue_file) as f:
-            return json.load(f)
-    return []
+    queue = cached_load(DATA_DIR / "queue.json", _read_json)
+    # Copy: process_cycle appends to the list before saving it
+    return list(queue) if queue is not None else []
 
 
 def save_queue(queue: list):
     """Save the story queue to file."""
     queue_file = DATA_DIR / "queue.json"
-    with open(queue_file, 'w') as f:
-        json.dump(queue, f, indent=2)
+    # Drop in-memory helper fields (e.g. "_words")
+    _write_json(queue_file, [{k: v for k, v in item.items() if not k.startswith("_")} for item in queue])
+    cache_store(queue_file, list(queue))
 
 
 def clean_expired_queue(queue: list) -> list:
@@ -2697,6 +3661,7 @@ def clean_expired_queue(queue: list) -> list:
     cutoff = datetime.now(timezone.utc).timestamp() - (timeout_hours * 3600)
 
     cleaned = []
+    expired = []  # (source_id, fact_hash) for ratings learning
     for item in queue:
         item_time = datetime.fromisoformat(item["timestamp"]).timestamp()
         if item_time > cutoff:
@@ -2704,49 +3669,124 @@ def clean_expired_queue(queue: list) -> list:
         else:
             log.info(f"Expired from queue: {item['fact'][:50]}...")
             # Record failure for ratings learning - story wasn't verified
-            fact_hash = get_story_hash(item["fact"])
-            record_verification_failure(item["source_id"], fact_hash)
+            expired.append((item["source_id"], get_story_hash(item["fact"])))
 
+    record_verification_failures_bulk(expired)
     return cleaned
 
 
+# =============================================================================
+# DEDUP STORE (Shown story hashes and processed headline hashes, per day)
+# =============================================================================
+
+DEDUP_DB_FILE = DATA_DIR / "dedup.sqlite"
+_dedup_db = None
+
+
+def _get_dedup_db() -> sqlite3.Connection:
+    """Return the shared dedup database, creating it on first use.
+
+    One table holds both kinds of hash ("shown", "processed") keyed by
+    UTC date. Legacy shown_*.txt / processed_*.txt files are imported.
+    """
+    global _dedup_db
+    if _dedup_db is None:
+        db = sqlite3.connect(DEDUP_DB_FILE)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "date TEXT, kind TEXT, hash TEXT, PRIMARY KEY (date, kind, hash)"
+            ") WITHOUT ROWID"
+        )
+        _import_legacy_hash_files(db)
+        _dedup_db = db
+    return _dedup_db
+
+
+def _import_legacy_hash_files(db: sqlite3.Connection):
+    """Move hashes from the old per-day text files into the database."""
+    for kind in ("shown", "processed"):
+        for path in DATA_DIR.glob(f"{kind}_????-??-??.txt"):
+            date = path.stem.split("_", 1)[1]
+            with open(path) as f:
+                rows = [(date, kind, line.strip()) for line in f if line.strip()]
+            with db:
+                db.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?, ?)", rows)
+            path.unlink()
+            log.info(f"Imported {len(rows)} hashes from {path.name} into {DEDUP_DB_FILE.name}")
+
+
+def load_seen_hashes(kind: str) -> set:
+    """Load today's hashes of one kind ("shown" or "processed")."""
+    today = utc_today()
+    rows = _get_dedup_db().execute(
+        "SELECT hash FROM seen WHERE date = ? AND kind = ?", (today, kind)
+    )
+    return {row[0] for row in rows}
+
+
+def add_seen_hash(kind: str, hash_value: str):
+    """Record a hash of this kind for today."""
+    today = utc_today()
+    db = _get_dedup_db()
+    with db:
+        db.execute("INSERT OR IGNORE INTO seen VALUES (?, ?, ?)", (today, kind, hash_value))
+
+
+def add_seen_hashes(kind: str, entries: list):
+    """Record several (date, hash) pairs of one kind in a single transaction."""
+    db = _get_dedup_db()
+    with db:
+        db.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?, ?)",
+                       [(date, kind, hash_value) for date, hash_value in entries])
+
+
+def clear_seen_hashes(through_date: str):
+    """Delete all hashes recorded on or before through_date (YYYY-MM-DD)."""
+    db = _get_dedup_db()
+    with db:
+        db.execute("DELETE FROM seen WHERE date <= ?", (through_date,))
+
+
 # =============================================================================
 # DUPLICATE DETECTION
 # =============================================================================
 
-def load_shown_hashes() -> set:
-    """Load hashes of stories shown today."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    hash_file = DATA_DIR / f"shown_{today}.txt"
+# Today's shown hashes, read from the dedup store once per day. Writes go
+# straight through to the store, so the set never holds unsaved hashes.
+_shown_hashes: set = set()
+_shown_date = None
+
 
-    if hash_file.exists():
-        with open(hash_file) as f:
-            return set(line.strip() for line in f if line.strip())
-    return set()
+def load_shown_hashes() -> set:
+    """Return hashes of stories shown today (live set, do not mutate)."""
+    global _shown_hashes, _shown_date
+    today = utc_today()
+    if _shown_date != today:
+        _shown_hashes = load_seen_hashes("shown")
+        _shown_date = today
+    return _shown_hashes
 
 
 def add_shown_hash(story_hash: str):
     """Add a hash to today's shown list."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    hash_file = DATA_DIR / f"shown_{today}.txt"
-
-    with open(hash_file, 'a') as f:
-        f.write(story_hash + '\n')
+    add_seen_hash("shown", story_hash)
+    if _shown_date == utc_today():
+        _shown_hashes.add(story_hash)
 
 
 def load_published_stories() -> list:
     """Load today's published stories from stories.json."""
     stories_file = DATA_DIR / "stories.json"
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
 
-    if stories_file.exists():
-        try:
-            with open(stories_file) as f:
-                data = json.load(f)
-            if data.get("date") == today:
-                return [s["fact"] for s in data.get("stories", [])]
-        except:
-            pass
+    try:
+        data = cached_load(stories_file, _read_json)
+        if data and data.get("date") == today:
+            return [s["fact"] for s in data.get("stories", [])]
+    except:
+        pass
     return []
 
 
@@ -2757,8 +3797,7 @@ def is_duplicate(fact: str) -> bool:
     """
     # Fast path: exact text match via hash
     story_hash = get_story_hash(fact)
-    shown = load_shown_hashes()
-    if story_hash in shown:
+    if story_hash in load_shown_hashes():
         return True
 
     # Semantic check: single Claude call to check against all published stories
@@ -2770,24 +3809,45 @@ def is_duplicate(fact: str) -> bool:
 # HEADLINE CACHE (Skip already-processed headlines to save API costs)
 # =============================================================================
 
+# Today's processed hashes, kept in memory across cycles. New hashes are
+# queued in _processed_pending and written by flush_processed_headlines().
+_processed_hashes: set = set()
+_processed_date = None
+_processed_pending: list = []  # (date, hash) not yet in the dedup store
+
+
 def load_processed_headlines() -> set:
-    """Load hashes of headlines already sent to Claude today."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cache_file = DATA_DIR / f"processed_{today}.txt"
+    """Return hashes of headlines already sent to Claude today.
 
-    if cache_file.exists():
-        with open(cache_file) as f:
-            return set(line.strip() for line in f if line.strip())
-    return set()
+    Read from the dedup store once per day. The caller gets a copy taken at
+    the start of its cycle, so a second source carrying the same headline
+    text in that cycle is still extracted and can corroborate the first.
+    """
+    global _processed_hashes, _processed_date
+    today = utc_today()
+    if _processed_date != today:
+        _processed_hashes = load_seen_hashes("processed")
+        _processed_hashes.update(h for d, h in _processed_pending if d == today)
+        _processed_date = today
+    return set(_processed_hashes)
 
 
 def add_processed_headline(headline_hash: str):
-    """Mark a headline as processed."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cache_file = DATA_DIR / f"processed_{today}.txt"
+    """Mark a headline as processed (persisted by flush_processed_headlines)."""
+    today = utc_today()
+    if _processed_date == today:
+        _processed_hashes.add(headline_hash)
+    _processed_pending.append((today, headline_hash))
+
+
+def flush_processed_headlines():
+    """Write pending processed-headline hashes to the dedup store."""
+    if _processed_pending:
+        add_seen_hashes("processed", _processed_pending)
+        _processed_pending.clear()
 
-    with open(cache_file, 'a') as f:
-        f.write(headline_hash + '\n')
+
+atexit.register(flush_processed_headlines)
 
 
 def is_headline_processed(headline_text: str, processed_cache: set) -> bool:
@@ -2800,43 +3860,123 @@ def is_headline_processed(headline_text: str, processed_cache: set) -> bool:
 # FACT EXTRACTION CACHE (Cache Claude responses to avoid redundant API calls)
 # =============================================================================
 
-# In-memory cache for fact extractions (headline_hash -> extraction result)
-_fact_extraction_cache: dict = {}
-
+# Today's fact extractions (headline_hash -> extraction result), most recently
+# used last and capped at FACT_CACHE_MAX entries. New results are queued in
+# _fact_cache_pending and appended to fact_cache_<date>.jsonl by
+# flush_fact_cache() (every FACT_CACHE_FLUSH_EVERY results, per cycle, at exit).
+FACT_CACHE_MAX = 10000
+FACT_CACHE_FLUSH_EVERY = 25
+_fact_extraction_cache: OrderedDict = OrderedDict()
+_fact_cache_date = None
+_fact_cache_pending: list = []  # (date, hash, result) not yet on disk
+_fact_cache_lock = threading.Lock()  # Extraction runs on worker threads
 
-def load_fact_extraction_cache() -> dict:
-    """Load cached fact extractions from disk."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cache_file = DATA_DIR / f"fact_cache_{today}.json"
-
-    if cache_file.exists():
-        try:
-            with open(cache_file) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
 
+def _fact_cache_file(date: str) -> Path:
+    return DATA_DIR / f"fact_cache_{date}.jsonl"
 
-def save_fact_extraction(headline_hash: str, result: dict):
-    """Save a fact extraction result to cache."""
-    global _fact_extraction_cache
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cache_file = DATA_DIR / f"fact_cache_{today}.json"
 
-    _fact_extraction_cache[headline_hash] = result
+def load_fact_extraction_cache() -> OrderedDict:
+    """Return today's fact extraction cache.
 
+    Streamed from the day's JSONL file once per day; the returned mapping
+    is live and updated by save_fact_extraction().
+    """
+    global _fact_extraction_cache, _fact_cache_date
+    today = utc_today()
+    with _fact_cache_lock:
+        if _fact_cache_date == today:
+            return _fact_extraction_cache
+
+        cache = OrderedDict()
+        # Snapshot left by the old whole-dict format (upgrade mid-day);
+        # JSONL lines replayed below take precedence
+        legacy_file = DATA_DIR / f"fact_cache_{today}.json"
+        if legacy_file.exists():
+            try:
+                cache.update(_read_json(legacy_file))
+            except (IOError, ValueError) as e:
+                log.warning(f"Could not load legacy fact cache: {e}")
+        cache_file = _fact_cache_file(today)
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            headline_hash, result = _json_loads(line)
+                        except (ValueError, TypeError):
+                            continue  # Torn last line after a crash
+                        cache[headline_hash] = result
+                        cache.move_to_end(headline_hash)
+                        if len(cache) > FACT_CACHE_MAX:
+                            cache.popitem(last=False)
+            except IOError as e:
+                log.warning(f"Could not load fact cache: {e}")
+        for date, headline_hash, result in _fact_cache_pending:
+            if date == today:
+                cache[headline_hash] = result
+
+        _fact_extraction_cache = cache
+        _fact_cache_date = today
+        return cache
+
+
+def _flush_fact_cache_locked():
+    """Append pending extractions to their day's JSONL file (lock held)."""
+    if not _fact_cache_pending:
+        return
+    by_date = {}
+    for date, headline_hash, result in _fact_cache_pending:
+        if orjson is not None:
+            line = orjson.dumps([headline_hash, result]) + b'\n'
+        else:
+            line = (json.dumps([headline_hash, result]) + '\n').encode()
+        by_date.setdefault(date, []).append(line)
     try:
-        with open(cache_file, 'w') as f:
-            json.dump(_fact_extraction_cache, f)
+        for date, lines in by_date.items():
+            with open(_fact_cache_file(date), 'ab') as f:
+                f.write(b"".join(lines))
+        _fact_cache_pending.clear()
     except IOError as e:
         log.warning(f"Could not save fact cache: {e}")
 
 
+def flush_fact_cache():
+    """Write pending fact extractions to disk."""
+    with _fact_cache_lock:
+        _flush_fact_cache_locked()
+
+
+atexit.register(flush_fact_cache)
+
+
+def lookup_fact_extraction(headline_hash: str) -> dict | None:
+    """Return the cached extraction for a headline hash (marks it recently used)."""
+    with _fact_cache_lock:
+        result = _fact_extraction_cache.get(headline_hash)
+        if result is not None:
+            _fact_extraction_cache.move_to_end(headline_hash)
+        return result
+
+
+def save_fact_extraction(headline_hash: str, result: dict):
+    """Save a fact extraction result to cache (persisted by flush_fact_cache)."""
+    today = utc_today()
+
+    with _fact_cache_lock:
+        if _fact_cache_date == today:
+            _fact_extraction_cache[headline_hash] = result
+            _fact_extraction_cache.move_to_end(headline_hash)
+            if len(_fact_extraction_cache) > FACT_CACHE_MAX:
+                _fact_extraction_cache.popitem(last=False)
+        _fact_cache_pending.append((today, headline_hash, result))
+        if len(_fact_cache_pending) >= FACT_CACHE_FLUSH_EVERY:
+            _flush_fact_cache_locked()
+
+
 def get_cached_fact_extraction(headline_text: str) -> dict | None:
     """Get cached extraction result if available."""
-    headline_hash = get_story_hash(headline_text)
-    return _fact_extraction_cache.get(headline_hash)
+    return lookup_fact_extraction(get_story_hash(headline_text))
 
 
 # =============================================================================
@@ -2849,12 +3989,11 @@ def get_next_audio_index() -> int:
     DEPRECATED: Use get_story_audio_id() for new code.
     """
     stories_file = DATA_DIR / "stories.json"
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
 
     if stories_file.exists():
         try:
-            with open(stories_file) as f:
-                stories = json.load(f)
+            stories = _read_json(stories_file)
             if stories.get("date") == today:
                 return len(stories.get("stories", []))
         except:
@@ -2894,7 +4033,7 @@ def generate_tts(text: str, audio_index: int = None, story_id: str = None, archi
         Audio filename on success, False on failure
     """
     try:
-        client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+        client = _get_elevenlabs()
 
         # Generate audio using the new client API
         audio_generator = client.text_to_speech.convert(
@@ -2909,49 +4048,64 @@ def generate_tts(text: str, audio_index: int = None, story_id: str = None, archi
             }
         )
 
-        # Collect audio data
-        audio_data = b''.join(chunk for chunk in audio_generator)
-
-        # Log API usage for cost tracking
-        log_api_usage("elevenlabs", {"characters": len(text)})
-
         # Determine filename and save location
         # story_id (hash-based): Write directly to today's archive folder (SAFE)
         # audio_index (legacy): Write to audio/ folder (can be overwritten - DEPRECATED)
         # neither: Write to current.mp3 only
+        current_path = AUDIO_DIR / "current.mp3"
         if story_id:
             # NEW: Write directly to archive folder to prevent overwrites
             # Use provided date or default to today UTC
-            folder_date = archive_date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            folder_date = archive_date or utc_today()
             archive_dir = AUDIO_DIR / "archive" / folder_date
             archive_dir.mkdir(parents=True, exist_ok=True)
 
             audio_filename = f"{story_id}.mp3"
             audio_path = archive_dir / audio_filename
-
-            with open(audio_path, 'wb') as f:
-                f.write(audio_data)
-
-            log.info(f"Generated TTS (archive/{folder_date}/{audio_filename}): {text[:50]}...")
+            location = f"archive/{folder_date}/{audio_filename}"
 
         elif audio_index is not None:
             # LEGACY: Write to audio/ folder (can still be overwritten)
             audio_filename = f"audio_{audio_index}.mp3"
             audio_path = AUDIO_DIR / audio_filename
-
-            with open(audio_path, 'wb') as f:
-                f.write(audio_data)
-
-            log.info(f"Generated TTS ({audio_filename}): {text[:50]}...")
+            location = audio_filename
 
         else:
             audio_filename = "current.mp3"
-            log.info(f"Generated TTS (current.mp3): {text[:50]}...")
+            audio_path = current_path
+            location = audio_filename
+
+        # Stream chunks straight to disk (no full copy of the MP3 in memory),
+        # and into current.mp3 at the same time for immediate playback.
+        # Written to .part files first so a dropped stream never leaves a
+        # truncated file, and the player never reads a half-written one.
+        targets = [audio_path]
+        if audio_path != current_path:
+            targets.append(current_path)
+        part_paths = [p.with_name(p.name + ".part") for p in targets]
+        files = []
+        try:
+            try:
+                for part_path in part_paths:
+                    files.append(open(part_path, 'wb'))
+                for chunk in audio_generator:
+                    for f in files:
+                        f.write(chunk)
+            finally:
+                for f in files:
+                    f.close()
+            for part_path, path in zip(part_paths, targets):
+                os.replace(part_path, path)
+        except BaseException:
+            # Dropped stream or full disk: don't leave .part files behind
+            for part_path in part_paths:
+                part_path.unlink(missing_ok=True)
+            raise
 
-        # Always save to current.mp3 for immediate playback
-        current_path = AUDIO_DIR / "current.mp3"
-        with open(current_path, 'wb') as f:
-            f.write(audio_data)
+        # Log API usage for cost tracking
+        log_api_usage("elevenlabs", {"characters": len(text)})
+
+        log.info(f"Generated TTS ({location}): {text[:50]}...")
 
         return audio_filename
 
@@ -3036,11 +4190,7 @@ def format_source_names_with_ratings(source_names_str: str) -> str:
 
     for name in names[:2]:  # Only show first 2
         # Look up source ID by name
-        source_id = None
-        for src in CONFIG["sources"]:
-            if src["name"] == name:
-                source_id = src["id"]
-                break
+        source_id = SOURCE_IDS_BY_NAME.get(name.lower())
 
         if source_id:
             formatted_parts.append(f"{name} {get_compact_scores(source_id)}")
@@ -3078,25 +4228,40 @@ def format_source_attribution(sources: list) -> str:
     return source_text
 
 
+# Last text written to each OBS text file (path -> text)
+_last_written_text: dict = {}
+
+
+def _write_text_if_changed(path: Path, text: str):
+    """Write text to path unless it already holds exactly that text.
+
+    OBS re-reads its text sources when the file changes, so republishing
+    the same story shouldn't touch the files.
+    """
+    if _last_written_text.get(path) == text and path.exists():
+        return
+    with open(path, 'w') as f:
+        f.write(text)
+    _last_written_text[path] = text
+
+
 def write_current_story(fact: str, sources: list):
     """Write the current story to output files."""
     # Format source attribution with evidence-based ratings
     source_text = format_source_attribution(sources)
 
     # Write current story
-    with open(DATA_DIR / "current.txt", 'w') as f:
-        f.write(fact)
+    _write_text_if_changed(DATA_DIR / "current.txt", fact)
 
     # Write source attribution
-    with open(DATA_DIR / "source.txt", 'w') as f:
-        f.write(source_text)
+    _write_text_if_changed(DATA_DIR / "source.txt", source_text)
 
     log.info(f"Published: {fact[:50]}...")
 
 
 def append_daily_log(fact: str, sources: list, audio_file: str = None):
     """Append story to daily log."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
     log_file = DATA_DIR / f"{today}.txt"
 
     timestamp = datetime.now(timezone.utc).isoformat()
@@ -3114,15 +4279,10 @@ def append_daily_log(fact: str, sources: list, audio_file: str = None):
     # Format: timestamp|names|scores|urls|audio|fact (6 fields)
     line = f"{timestamp}|{source_names}|{source_scores}|{source_urls}|{audio_name}|{fact}\n"
 
-    # Create header if new file
-    if not log_file.exists():
-        with open(log_file, 'w') as f:
-            f.write(f"# JTF News Daily Log\n")
-            f.write(f"# Date: {today}\n")
-            f.write(f"# Generated: UTC\n\n")
-
+    # Header only for a new file; header and line go out in one write
+    header = "" if log_file.exists() else f"# JTF News Daily Log\n# Date: {today}\n# Generated: UTC\n\n"
     with open(log_file, 'a') as f:
-        f.write(line)
+        f.write(header + line)
 
     # Also update stories.json for JS loop
     update_stories_json(fact, sources, audio_file)
@@ -3136,15 +4296,14 @@ def generate_story_id(date: str, index: int) -> str:
 def update_stories_json(fact: str, sources: list, audio_file: str = None):
     """Update stories.json for the JS loop display."""
     stories_file = DATA_DIR / "stories.json"
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
     now_iso = datetime.now(timezone.utc).isoformat()
 
     # Load existing stories
     stories = {"date": today, "stories": []}
     if stories_file.exists():
         try:
-            with open(stories_file) as f:
-                stories = json.load(f)
+            stories = _read_json(stories_file)
             # Reset if it's a new day
             if stories.get("date") != today:
                 stories = {"date": today, "stories": []}
@@ -3187,25 +4346,155 @@ def update_stories_json(fact: str, sources: list, audio_file: str = None):
         "status": "published"
     })
 
-    # Write back
-    with open(stories_file, 'w') as f:
-        json.dump(stories, f, indent=2)
+    # Write back (and keep the parse for the next duplicate/match check)
+    _write_json(stories_file, stories)
+    cache_store(stories_file, stories)
 
     # Also copy to docs for screensaver
     docs_dir = BASE_DIR / "docs"
     if docs_dir.exists():
-        import shutil
         shutil.copy(stories_file, docs_dir / "stories.json")
 
-    # Update RSS feed
-    update_rss_feed(fact, sources)
+    # Update RSS and Alexa Flash Briefing feeds, then push everything
+    # in one batch instead of once per feed
+    feed_file = update_rss_feed(fact, sources)
+    alexa_file = update_alexa_feed(fact, sources)
+
+    gh_files = []
+    if feed_file:
+        gh_files += [(feed_file, "feed.xml"), (stories_file, "stories.json")]
+    if alexa_file:
+        gh_files.append((alexa_file, "alexa.json"))
+    if gh_files:
+        push_to_ghpages(gh_files, f"Update feed: {fact[:50]}")
+
+
+# Item dicts of the last feed.xml written by update_rss_feed, so the next
+# update doesn't have to parse the XML back
+FEED_ITEMS_FILE = DATA_DIR / "feed_items.json"
+
+RSS_JTF_NS = "https://jtfnews.com/rss"
+RSS_ATOM_NS = "http://www.w3.org/2005/Atom"
+
+# Register prefixes once so every ElementTree writer emits jtf:/atom: with a
+# single xmlns declaration each (no post-write cleanup needed)
+ET.register_namespace("jtf", RSS_JTF_NS)
+ET.register_namespace("atom", RSS_ATOM_NS)
+
+# Static start of feed.xml (everything before lastBuildDate)
+_RSS_HEADER = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    f'<rss xmlns:atom="{RSS_ATOM_NS}" xmlns:jtf="{RSS_JTF_NS}" version="2.0">\n'
+    "  <channel>\n"
+    "    <title>JTF News - Just The Facts</title>\n"
+    "    <link>https://jtfnews.org/</link>\n"
+    "    <description>Verified facts from multiple sources. No opinions. No adjectives. "
+    "No interpretation. Viewer-supported at github.com/sponsors/larryseyer</description>\n"
+    "    <language>en-us</language>\n"
+)
+_RSS_ATOM_LINK = ('    <atom:link href="https://jtfnews.org/feed.xml" rel="self" '
+                  'type="application/rss+xml" />\n')
+
+
+def _xml_text(value) -> str:
+    """Escape element text the way ElementTree does."""
+    return str(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+@lru_cache(maxsize=4096)
+def _xml_attr(value) -> str:
+    """Escape and quote an attribute value the way ElementTree does.
+
+    Cached: source names, ratings and owners repeat across feed items.
+    """
+    value = (_xml_text(value).replace('"', "&quot;")
+             .replace("\r", "&#13;").replace("\n", "&#10;").replace("\t", "&#09;"))
+    return f'"{value}"'
+
+
+def _xml_element(tag: str, text, indent: int) -> str:
+    """Render one indented text-only element line."""
+    if not text:
+        return f"{' ' * indent}<{tag} />\n"
+    return f"{' ' * indent}<{tag}>{_xml_text(text)}</{tag}>\n"
+
 
-    # Update Alexa Flash Briefing feed
-    update_alexa_feed(fact, sources)
+def _parse_rss_items(feed_file: Path, jtf_ns: str) -> list:
+    """Parse the items of an existing feed.xml into update_rss_feed's item dicts."""
+    items = []
+    # Stream the feed: each <item> is converted and cleared as soon as it
+    # closes, so only one item's subtree is held at a time
+    for _, item in ET.iterparse(feed_file, events=("end",)):
+        if item.tag != "item":
+            continue
+        # Parse rich source structure (check both namespaced and non-namespaced)
+        item_sources = []
+        # Try namespaced version first
+        for source_el in item.findall(f"{{{jtf_ns}}}source"):
+            source_data = {
+                "name": source_el.get("name", ""),
+                "url": source_el.get("url", ""),
+                "accuracy": source_el.get("accuracy", "0.0"),
+                "bias": source_el.get("bias", "0.0"),
+                "speed": source_el.get("speed", "0.0"),
+                "consensus": source_el.get("consensus", "0.0"),
+                "control_type": source_el.get("control_type", "unknown"),
+                "owners": []
+            }
+            for owner_el in source_el.findall(f"{{{jtf_ns}}}owner"):
+                source_data["owners"].append({
+                    "name": owner_el.get("name", ""),
+                    "percent": owner_el.get("percent", "0.0")
+                })
+            item_sources.append(source_data)
+
+        # Fall back to non-namespaced (legacy migration)
+        if not item_sources:
+            for source_el in item.findall("source"):
+                if source_el.get("name"):
+                    source_data = {
+                        "name": source_el.get("name", ""),
+                        "url": source_el.get("url", ""),
+                        "accuracy": source_el.get("accuracy", "0.0"),
+                        "bias": source_el.get("bias", "0.0"),
+                        "speed": source_el.get("speed", "0.0"),
+                        "consensus": source_el.get("consensus", "0.0"),
+                        "control_type": source_el.get("control_type", "unknown"),
+                        "owners": []
+                    }
+                    for owner_el in source_el.findall("owner"):
+                        source_data["owners"].append({
+                            "name": owner_el.get("name", ""),
+                            "percent": owner_el.get("percent", "0.0")
+                        })
+                    item_sources.append(source_data)
+                elif source_el.text:
+                    # Very old format: plain text
+                    for name in source_el.text.split(", "):
+                        item_sources.append({
+                            "name": name.strip(),
+                            "url": "",
+                            "accuracy": "0.0", "bias": "0.0",
+                            "speed": "0.0", "consensus": "0.0",
+                            "control_type": "unknown", "owners": []
+                        })
+
+        items.append({
+            "title": item.find("title").text or "",
+            "description": item.find("description").text or "",
+            "sources": item_sources,
+            "pubDate": item.find("pubDate").text or "",
+            "guid": item.find("guid").text or ""
+        })
+        item.clear()
+    return items
 
 
 def update_rss_feed(fact: str, sources: list):
-    """Update RSS feed with new story and push to GitHub.
+    """Update RSS feed with new story.
+
+    Returns the feed path (pushed to GitHub by update_stories_json),
+    or None if the docs worktree is missing.
 
     Per SPECIFICATION.md Section 5.3.3, each source element includes:
     - name, accuracy, bias, speed, consensus as attributes
@@ -3213,16 +4502,6 @@ def update_rss_feed(fact: str, sources: list):
 
     Uses jtf: namespace for custom elements to comply with RSS 2.0.
     """
-    import subprocess
-
-    # Namespace URIs
-    JTF_NS = "https://jtfnews.com/rss"
-    ATOM_NS = "http://www.w3.org/2005/Atom"
-
-    # Register namespaces for clean XML output
-    ET.register_namespace("jtf", JTF_NS)
-    ET.register_namespace("atom", ATOM_NS)
-
     docs_dir = BASE_DIR / "docs"
     feed_file = docs_dir / "feed.xml"
     max_items = 100  # Keep last 100 stories in feed
@@ -3230,7 +4509,7 @@ def update_rss_feed(fact: str, sources: list):
     # Check if docs folder exists
     if not docs_dir.exists():
         log.warning("docs worktree not found, skipping RSS update")
-        return
+        return None
 
     # Build rich source data for each source (top 2)
     rich_sources = []
@@ -3240,7 +4519,7 @@ def update_rss_feed(fact: str, sources: list):
 
     # Create new item
     pub_date = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
-    guid = hashlib.md5(f"{fact}{pub_date}".encode()).hexdigest()[:12]
+    guid = hashlib.blake2b(f"{fact}{pub_date}".encode(), digest_size=6).hexdigest()
 
     # Truncate fact for title (first 80 chars)
     title = fact[:80] + "..." if len(fact) > 80 else fact
@@ -3253,75 +4532,18 @@ def update_rss_feed(fact: str, sources: list):
         "guid": guid
     }
 
-    # Load existing items or create new
+    # Load existing items: the sidecar is current unless something else
+    # (corrections, digest entries) rewrote feed.xml since we last did
     items = []
     if feed_file.exists():
-        try:
-            tree = ET.parse(feed_file)
-            root = tree.getroot()
-            channel = root.find("channel")
-            for item in channel.findall("item"):
-                # Parse rich source structure (check both namespaced and non-namespaced)
-                item_sources = []
-                # Try namespaced version first
-                for source_el in item.findall(f"{{{JTF_NS}}}source"):
-                    source_data = {
-                        "name": source_el.get("name", ""),
-                        "url": source_el.get("url", ""),
-                        "accuracy": source_el.get("accuracy", "0.0"),
-                        "bias": source_el.get("bias", "0.0"),
-                        "speed": source_el.get("speed", "0.0"),
-                        "consensus": source_el.get("consensus", "0.0"),
-                        "control_type": source_el.get("control_type", "unknown"),
-                        "owners": []
-                    }
-                    for owner_el in source_el.findall(f"{{{JTF_NS}}}owner"):
-                        source_data["owners"].append({
-                            "name": owner_el.get("name", ""),
-                            "percent": owner_el.get("percent", "0.0")
-                        })
-                    item_sources.append(source_data)
-
-                # Fall back to non-namespaced (legacy migration)
-                if not item_sources:
-                    for source_el in item.findall("source"):
-                        if source_el.get("name"):
-                            source_data = {
-                                "name": source_el.get("name", ""),
-                                "url": source_el.get("url", ""),
-                                "accuracy": source_el.get("accuracy", "0.0"),
-                                "bias": source_el.get("bias", "0.0"),
-                                "speed": source_el.get("speed", "0.0"),
-                                "consensus": source_el.get("consensus", "0.0"),
-                                "control_type": source_el.get("control_type", "unknown"),
-                                "owners": []
-                            }
-                            for owner_el in source_el.findall("owner"):
-                                source_data["owners"].append({
-                                    "name": owner_el.get("name", ""),
-                                    "percent": owner_el.get("percent", "0.0")
-                                })
-                            item_sources.append(source_data)
-                        elif source_el.text:
-                            # Very old format: plain text
-                            for name in source_el.text.split(", "):
-                                item_sources.append({
-                                    "name": name.strip(),
-                                    "url": "",
-                                    "accuracy": "0.0", "bias": "0.0",
-                                    "speed": "0.0", "consensus": "0.0",
-                                    "control_type": "unknown", "owners": []
-                                })
-
-                items.append({
-                    "title": item.find("title").text or "",
-                    "description": item.find("description").text or "",
-                    "sources": item_sources,
-                    "pubDate": item.find("pubDate").text or "",
-                    "guid": item.find("guid").text or ""
-                })
-        except Exception as e:
-            log.warning(f"Error parsing existing RSS feed: {e}")
+        sidecar = cached_load(FEED_ITEMS_FILE, _read_json)
+        if sidecar and sidecar.get("feed_key") == list(_file_key(feed_file)):
+            items = list(sidecar["items"])
+        else:
+            try:
+                items = _parse_rss_items(feed_file, RSS_JTF_NS)
+            except Exception as e:
+                log.warning(f"Error parsing existing RSS feed: {e}")
 
     # Add new item at beginning
     items.insert(0, new_item)
@@ -3329,69 +4551,49 @@ def update_rss_feed(fact: str, sources: list):
     # Trim to max items
     items = items[:max_items]
 
-    # Build RSS XML (namespaces added via register_namespace above)
-    rss = ET.Element("rss", {"version": "2.0"})
-    # Manually set namespace attributes to ensure they appear on root element
-    rss.set(f"xmlns:jtf", JTF_NS)
-    rss.set(f"xmlns:atom", ATOM_NS)
-
-    channel = ET.SubElement(rss, "channel")
-
-    ET.SubElement(channel, "title").text = "JTF News - Just The Facts"
-    ET.SubElement(channel, "link").text = "https://jtfnews.org/"
-    ET.SubElement(channel, "description").text = "Verified facts from multiple sources. No opinions. No adjectives. No interpretation. Viewer-supported at github.com/sponsors/larryseyer"
-    ET.SubElement(channel, "language").text = "en-us"
-    ET.SubElement(channel, "lastBuildDate").text = pub_date
-
-    # Add atom:link for RSS compliance
-    ET.SubElement(channel, f"{{{ATOM_NS}}}link", {
-        "href": "https://jtfnews.org/feed.xml",
-        "rel": "self",
-        "type": "application/rss+xml"
-    })
-
+    # Write the feed directly - the schema is fixed, so there is no need
+    # to build (and pretty-print) an ElementTree first
+    parts = [_RSS_HEADER, f"    <lastBuildDate>{_xml_text(pub_date)}</lastBuildDate>\n", _RSS_ATOM_LINK]
     for item_data in items:
-        item = ET.SubElement(channel, "item")
-        ET.SubElement(item, "title").text = item_data["title"]
-        ET.SubElement(item, "description").text = item_data["description"]
+        parts.append("    <item>\n")
+        parts.append(_xml_element("title", item_data["title"], 6))
+        parts.append(_xml_element("description", item_data["description"], 6))
 
-        # Write namespaced source elements per SPECIFICATION.md
+        # Namespaced source elements per SPECIFICATION.md
         for source_data in item_data.get("sources", []):
-            source_el = ET.SubElement(item, f"{{{JTF_NS}}}source", {
-                "name": source_data["name"],
-                "url": source_data.get("url", ""),
-                "accuracy": source_data["accuracy"],
-                "bias": source_data["bias"],
-                "speed": source_data["speed"],
-                "consensus": source_data["consensus"],
-                "control_type": source_data["control_type"]
-            })
-            for owner in source_data.get("owners", []):
-                ET.SubElement(source_el, f"{{{JTF_NS}}}owner", {
-                    "name": owner["name"],
-                    "percent": owner["percent"]
-                })
+            attrs = (
+                f'name={_xml_attr(source_data["name"])} '
+                f'url={_xml_attr(source_data.get("url", ""))} '
+                f'accuracy={_xml_attr(source_data["accuracy"])} '
+                f'bias={_xml_attr(source_data["bias"])} '
+                f'speed={_xml_attr(source_data["speed"])} '
+                f'consensus={_xml_attr(source_data["consensus"])} '
+                f'control_type={_xml_attr(source_data["control_type"])}'
+            )
+            owners = source_data.get("owners", [])
+            if not owners:
+                parts.append(f"      <jtf:source {attrs} />\n")
+                continue
+            parts.append(f"      <jtf:source {attrs}>\n")
+            for owner in owners:
+                parts.append(f"        <jtf:owner name={_xml_attr(owner['name'])} "
+                             f"percent={_xml_attr(owner['percent'])} />\n")
+            parts.append("      </jtf:source>\n")
 
-        ET.SubElement(item, "pubDate").text = item_data["pubDate"]
-        ET.SubElement(item, "guid", isPermaLink="false").text = item_data["guid"]
+        parts.append(_xml_element("pubDate", item_data["pubDate"], 6))
+        parts.append(f'      <guid isPermaLink="false">{_xml_text(item_data["guid"])}</guid>\n')
+        parts.append("    </item>\n")
+    parts.append("  </channel>\n</rss>\n")
 
-    # Write with XML declaration (use custom indent for Python 3.8 compatibility)
-    indent_xml(rss, space="  ")
-    tree = ET.ElementTree(rss)
-    with open(feed_file, 'wb') as f:
-        tree.write(f, encoding="utf-8", xml_declaration=True)
+    _atomic_write(feed_file, "".join(parts))
 
-    # Clean up duplicate namespace declarations (ElementTree quirk)
-    clean_duplicate_namespaces(feed_file)
+    # Remember the items, tied to the feed.xml we just wrote
+    sidecar = {"feed_key": list(_file_key(feed_file)), "items": items}
+    _write_json(FEED_ITEMS_FILE, sidecar)
+    cache_store(FEED_ITEMS_FILE, sidecar)
 
     log.info(f"RSS feed updated: {len(items)} items")
-
-    # Push to GitHub via API
-    stories_file = DATA_DIR / "stories.json"
-    push_to_ghpages([
-        (feed_file, "feed.xml"),
-        (stories_file, "stories.json")
-    ], f"Update feed: {title[:50]}")
+    return feed_file
 
 
 def add_correction_to_rss(correction_type: str, original_fact: str,
@@ -3402,15 +4604,10 @@ def add_correction_to_rss(correction_type: str, original_fact: str,
     Corrections only have source names (not IDs), so ratings are omitted.
     Uses jtf: namespace for custom elements to comply with RSS 2.0.
     """
-    import subprocess
 
-    # Namespace URIs
-    JTF_NS = "https://jtfnews.com/rss"
-    ATOM_NS = "http://www.w3.org/2005/Atom"
-
-    # Register namespaces for clean XML output
-    ET.register_namespace("jtf", JTF_NS)
-    ET.register_namespace("atom", ATOM_NS)
+    # Namespace URIs (prefixes are registered with ElementTree at import)
+    JTF_NS = RSS_JTF_NS
+    ATOM_NS = RSS_ATOM_NS
 
     docs_dir = BASE_DIR / "docs"
     feed_file = docs_dir / "feed.xml"
@@ -3432,7 +4629,7 @@ def add_correction_to_rss(correction_type: str, original_fact: str,
         description = f"CORRECTION: Earlier we reported that {original_fact}. {source_text} now report that {corrected_fact}."
 
     pub_date = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
-    guid = hashlib.md5(f"correction-{story_id}-{pub_date}".encode()).hexdigest()[:12]
+    guid = hashlib.blake2b(f"correction-{story_id}-{pub_date}".encode(), digest_size=6).hexdigest()
 
     # Build source data (corrections only have names, not full ratings)
     rich_sources = []
@@ -3572,9 +4769,6 @@ def add_correction_to_rss(correction_type: str, original_fact: str,
     with open(feed_file, 'wb') as f:
         tree.write(f, encoding="utf-8", xml_declaration=True)
 
-    # Clean up duplicate namespace declarations (ElementTree quirk)
-    clean_duplicate_namespaces(feed_file)
-
     log.info(f"RSS feed updated with {correction_type}: {title[:50]}")
 
     # Push to GitHub via API
@@ -3591,13 +4785,9 @@ def regenerate_rss_feed():
     and rebuilds the feed in the new format per SPECIFICATION.md Section 5.3.3.
     Uses jtf: namespace for custom elements to comply with RSS 2.0.
     """
-    # Namespace URIs
-    JTF_NS = "https://jtfnews.com/rss"
-    ATOM_NS = "http://www.w3.org/2005/Atom"
-
-    # Register namespaces for clean XML output
-    ET.register_namespace("jtf", JTF_NS)
-    ET.register_namespace("atom", ATOM_NS)
+    # Namespace URIs (prefixes are registered with ElementTree at import)
+    JTF_NS = RSS_JTF_NS
+    ATOM_NS = RSS_ATOM_NS
 
     docs_dir = BASE_DIR / "docs"
     feed_file = docs_dir / "feed.xml"
@@ -3608,8 +4798,7 @@ def regenerate_rss_feed():
         return False
 
     # Load stories
-    with open(stories_file) as f:
-        data = json.load(f)
+    data = _read_json(stories_file)
 
     stories = data.get("stories", [])
     if not stories:
@@ -3626,7 +4815,6 @@ def regenerate_rss_feed():
         rich_sources = []
         for part in source_str.split(" · "):
             # Extract source name (everything before the first digit or asterisk)
-            import re
             match = re.match(r'^([A-Za-z\s\-\.]+)', part.strip())
             if match:
                 source_name = match.group(1).strip()
@@ -3743,11 +4931,9 @@ def regenerate_rss_feed():
     # Trim to max 100 items
     items = items[:100]
 
-    # Build RSS XML (namespaces added via register_namespace above)
+    # Build RSS XML (ElementTree declares the registered namespaces once)
     pub_date = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
     rss = ET.Element("rss", {"version": "2.0"})
-    rss.set(f"xmlns:jtf", JTF_NS)
-    rss.set(f"xmlns:atom", ATOM_NS)
 
     channel = ET.SubElement(rss, "channel")
 
@@ -3794,9 +4980,6 @@ def regenerate_rss_feed():
     with open(feed_file, 'wb') as f:
         tree.write(f, encoding="utf-8", xml_declaration=True)
 
-    # Clean up duplicate namespace declarations (ElementTree quirk)
-    clean_duplicate_namespaces(feed_file)
-
     log.info(f"RSS feed regenerated: {len(items)} items with rich source data")
     return True
 
@@ -3806,15 +4989,9 @@ def add_digest_to_feed(date: str, story_count: int, youtube_id: str):
 
     Creates a special item with jtf:type="digest" attribute.
     """
-    import subprocess
-
-    # Namespace URIs
-    JTF_NS = "https://jtfnews.com/rss"
-    ATOM_NS = "http://www.w3.org/2005/Atom"
-
-    # Register namespaces for clean XML output
-    ET.register_namespace("jtf", JTF_NS)
-    ET.register_namespace("atom", ATOM_NS)
+    # Namespace URIs (prefixes are registered with ElementTree at import)
+    JTF_NS = RSS_JTF_NS
+    ATOM_NS = RSS_ATOM_NS
 
     docs_dir = BASE_DIR / "docs"
     feed_file = docs_dir / "feed.xml"
@@ -3911,35 +5088,22 @@ def add_digest_to_feed(date: str, story_count: int, youtube_id: str):
         with open(feed_file, 'wb') as f:
             tree.write(f, encoding="utf-8", xml_declaration=True)
 
-        clean_duplicate_namespaces(feed_file)
-
         log.info(f"Added digest entry for {date} to RSS feed")
 
-        # Push to GitHub
-        try:
-            subprocess.run(
-                ["git", "-C", str(docs_dir), "add", "feed.xml"],
-                capture_output=True, check=True
-            )
-            subprocess.run(
-                ["git", "-C", str(docs_dir), "commit", "-m", f"Add digest entry for {date}"],
-                capture_output=True, check=True
-            )
-            subprocess.run(
-                ["git", "-C", str(docs_dir), "push"],
-                capture_output=True, check=True
-            )
-            log.info("Pushed digest feed entry to GitHub")
-        except subprocess.CalledProcessError as e:
-            log.warning(f"Could not push digest entry to GitHub: {e}")
+        # Push to GitHub via API (same path as the other feed updates)
+        if not push_to_ghpages([(feed_file, "feed.xml")], f"Add digest entry for {date}"):
+            log.warning("Could not push digest entry to GitHub")
 
     except Exception as e:
         log.error(f"Failed to add digest to feed: {e}")
 
 
 def update_alexa_feed(fact: str, sources: list):
-    """Update Alexa Flash Briefing JSON feed and push to GitHub."""
-    import subprocess
+    """Update Alexa Flash Briefing JSON feed.
+
+    Returns the feed path (pushed to GitHub by update_stories_json),
+    or None if the docs worktree is missing.
+    """
 
     docs_dir = BASE_DIR / "docs"
     alexa_file = docs_dir / "alexa.json"
@@ -3948,14 +5112,14 @@ def update_alexa_feed(fact: str, sources: list):
     # Check if docs folder exists
     if not docs_dir.exists():
         log.warning("docs worktree not found, skipping Alexa feed update")
-        return
+        return None
 
     # Format source attribution
     source_text = ", ".join([s['source_name'] for s in sources[:2]])
 
     # Create new item in Alexa Flash Briefing format
     update_date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.0Z")
-    uid = hashlib.md5(f"{fact}{update_date}".encode()).hexdigest()
+    uid = hashlib.blake2b(f"{fact}{update_date}".encode(), digest_size=16).hexdigest()
 
     new_item = {
         "uid": uid,
@@ -3969,8 +5133,7 @@ def update_alexa_feed(fact: str, sources: list):
     items = []
     if alexa_file.exists():
         try:
-            with open(alexa_file) as f:
-                items = json.load(f)
+            items = _read_json(alexa_file)
         except:
             pass
 
@@ -3980,14 +5143,11 @@ def update_alexa_feed(fact: str, sources: list):
     # Trim to max items
     items = items[:max_items]
 
-    # Write JSON
-    with open(alexa_file, 'w') as f:
-        json.dump(items, f, indent=2)
+    # Write JSON (atomic, like stories.json and feed.xml)
+    _write_json(alexa_file, items)
 
     log.info(f"Alexa feed updated: {len(items)} items")
-
-    # Push to GitHub via API
-    push_to_ghpages([(alexa_file, "alexa.json")], "Update Alexa feed")
+    return alexa_file
 
 
 # =============================================================================
@@ -4013,10 +5173,7 @@ def send_alert(message: str, alert_type: str = "general"):
         return
 
     try:
-        client = TwilioClient(
-            os.getenv("TWILIO_ACCOUNT_SID"),
-            os.getenv("TWILIO_AUTH_TOKEN")
-        )
+        client = _get_twilio()
 
         client.messages.create(
             body=f"JTF: {message}",
@@ -4035,6 +5192,52 @@ def send_alert(message: str, alert_type: str = "general"):
         track_api_failure("twilio", False)
 
 
+# Alerts raised from API failure paths are sent by a background thread
+ALERT_DRAIN_SECONDS = 10  # Time allowed at exit for alerts still queued
+_alert_queue = SimpleQueue()
+_alert_thread = None
+_alert_thread_lock = threading.Lock()
+
+
+def _alert_worker():
+    """Send queued alerts, coalescing identical ones queued in a burst."""
+    while True:
+        batch = [_alert_queue.get()]
+        while not _alert_queue.empty():
+            batch.append(_alert_queue.get_nowait())
+        for message, alert_type in dict.fromkeys(batch):
+            send_alert(message, alert_type)
+
+
+def send_alert_async(message: str, alert_type: str = "general"):
+    """Queue an alert for send_alert on the background alert thread."""
+    global _alert_thread
+    with _alert_thread_lock:
+        if _alert_thread is None:
+            _alert_thread = threading.Thread(target=_alert_worker, name="jtf-alerts", daemon=True)
+            _alert_thread.start()
+    _alert_queue.put((message, alert_type))
+
+
+def drain_alerts():
+    """Send alerts still queued at exit; the daemon alert thread won't."""
+    batch = []
+    while True:
+        try:
+            batch.append(_alert_queue.get_nowait())
+        except Empty:
+            break
+    deadline = time.monotonic() + ALERT_DRAIN_SECONDS
+    for message, alert_type in dict.fromkeys(batch):
+        if time.monotonic() >= deadline:
+            log.error(f"Alert not sent before exit: {message}")
+            continue
+        send_alert(message, alert_type)
+
+
+atexit.register(drain_alerts)
+
+
 # =============================================================================
 # STREAM MONITORING
 # =============================================================================
@@ -4093,20 +5296,25 @@ def check_stream_health():
 
 def get_recent_facts(hours: int = 24) -> list:
     """Get facts published in the last N hours."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
     log_file = DATA_DIR / f"{today}.txt"
 
+    if not log_file.exists():
+        return []
+
+    # Keep only the last 20 story lines while streaming; parse just those
+    with open(log_file) as f:
+        tail = deque((line for line in f if not line.startswith("#") and line.strip()), maxlen=20)
+
     facts = []
-    if log_file.exists():
-        with open(log_file) as f:
-            for line in f:
-                if line.startswith("#") or not line.strip():
-                    continue
-                parts = line.strip().split("|")
-                if len(parts) >= 4:
-                    facts.append(parts[3].strip())
+    for line in tail:
+        parts = line.strip().split("|")
+        if len(parts) >= 4:
+            # Fact is the 4th/5th field in old logs, and everything from the
+            # 6th field on in current ones (the fact itself may contain "|")
+            facts.append("|".join(parts[min(len(parts), 6) - 1:]).strip())
 
-    return facts[-20:]  # Last 20 facts max
+    return facts
 
 
 def check_contradiction(new_fact: str, recent_facts: list) -> bool:
@@ -4117,6 +5325,12 @@ def check_contradiction(new_fact: str, recent_facts: list) -> bool:
     # Only check against last 5 facts to save tokens
     check_facts = recent_facts[-5:]
 
+    # Facts about different events can't contradict: skip the API call
+    # unless some recent fact shares enough words with the new one
+    new_words = fact_words(new_fact)
+    if not any(has_word_overlap(new_words, published_fact_words(f), threshold=0.2) for f in check_facts):
+        return False
+
     prompt = f"""Check if this NEW FACT contradicts any of the RECENT FACTS below.
 
 NEW FACT: {new_fact}
@@ -4130,7 +5344,7 @@ Minor updates or additions are NOT contradictions.
 Return JSON: {{"contradiction": true/false, "reason": "brief explanation if true"}}"""
 
     try:
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=100,
@@ -4190,7 +5404,6 @@ def save_corrections(corrections: dict):
     # Sync to docs for public access
     docs_dir = BASE_DIR / "docs"
     if docs_dir.exists():
-        import shutil
         shutil.copy(CORRECTIONS_FILE, docs_dir / "corrections.json")
         log.info("Corrections synced to docs")
 
@@ -4203,13 +5416,12 @@ def get_recent_stories_for_correction(days: int = 7) -> list:
     # Get today's stories
     if stories_file.exists():
         try:
-            with open(stories_file) as f:
-                data = json.load(f)
-                for i, story in enumerate(data.get("stories", [])):
-                    # Add index for reference
-                    story["_index"] = i
-                    story["_date"] = data.get("date", "")
-                    all_stories.append(story)
+            data = _read_json(stories_file)
+            for i, story in enumerate(data.get("stories", [])):
+                # Add index for reference
+                story["_index"] = i
+                story["_date"] = data.get("date", "")
+                all_stories.append(story)
         except:
             pass
 
@@ -4295,7 +5507,7 @@ If NO correction needed, return:
 {{"needs_correction": false}}"""
 
     try:
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=200,
@@ -4342,8 +5554,7 @@ def issue_correction(story_id: str, original_fact: str, corrected_fact: str,
     stories = {"date": "", "stories": []}
     if stories_file.exists():
         try:
-            with open(stories_file) as f:
-                stories = json.load(f)
+            stories = _read_json(stories_file)
         except:
             pass
 
@@ -4364,8 +5575,7 @@ def issue_correction(story_id: str, original_fact: str, corrected_fact: str,
             break
 
     if story_updated:
-        with open(stories_file, 'w') as f:
-            json.dump(stories, f, indent=2)
+        _write_json(stories_file, stories)
         log.info(f"Story {story_id} marked as corrected")
     else:
         log.warning(f"Correction target not found: story_id={story_id} not in stories.json")
@@ -4423,8 +5633,7 @@ def issue_retraction(story_id: str, original_fact: str, reason: str, sources: li
     story_found = False
     if stories_file.exists():
         try:
-            with open(stories_file) as f:
-                stories = json.load(f)
+            stories = _read_json(stories_file)
         except:
             pass
 
@@ -4442,8 +5651,7 @@ def issue_retraction(story_id: str, original_fact: str, reason: str, sources: li
             break
 
     if story_found:
-        with open(stories_file, 'w') as f:
-            json.dump(stories, f, indent=2)
+        _write_json(stories_file, stories)
         log.info(f"Story {story_id} marked as retracted")
     else:
         log.warning(f"Retraction target not found: story_id={story_id} not in stories.json")
@@ -4522,36 +5730,42 @@ def generate_retraction_audio(original_fact: str, reason: str, sources: list):
 # BREAKING NEWS UPDATES (3rd+ source details)
 # =============================================================================
 
+# Lowercased word sets of published facts (fact text -> frozenset), so
+# each story is tokenized once per process rather than once per headline
+_published_story_words: dict = {}
+
+
 def find_matching_published_story(new_fact: str) -> dict | None:
     """Check if new fact matches any already-published story today."""
     stories_file = DATA_DIR / "stories.json"
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-    if not stories_file.exists():
-        return None
+    today = utc_today()
 
     try:
-        with open(stories_file) as f:
-            data = json.load(f)
+        data = cached_load(stories_file, _read_json)
 
-        if data.get("date") != today:
+        if not data or data.get("date") != today:
             return None
 
+        if len(_published_story_words) > 2000:  # Bound memory across days
+            _published_story_words.clear()
+
         # Use same word overlap filter as queue matching
         new_words = set(new_fact.lower().split())
 
         for idx, story in enumerate(data.get("stories", [])):
             existing_fact = story.get("fact", "")
-            existing_words = set(existing_fact.lower().split())
+            existing_words = _published_story_words.get(existing_fact)
+            if existing_words is None:
+                existing_words = _published_story_words[existing_fact] = frozenset(existing_fact.lower().split())
 
             # Check for significant word overlap (same event)
             overlap = len(new_words & existing_words)
             min_len = min(len(new_words), len(existing_words))
 
             if min_len > 0 and overlap / min_len > 0.3:
-                # Potential match - return story with index
-                story["_index"] = idx
-                return story
+                # Potential match - return a copy of the story with its index
+                # (the parsed file is shared through the file cache)
+                return {**story, "_index": idx}
 
         return None
 
@@ -4601,6 +5815,11 @@ FEMALE_NAMES = {
 }
 
 
+# Title + name at start of sentence
+# Matches: "Title Name Name" or just "Name Name"
+_SUBJECT_TITLE_RE = re.compile(r'^((?:President|Secretary of State|Senator|Representative|Governor|Minister|Prime Minister|Chancellor|Director|Chief|General|Admiral|Mayor|Attorney General|Press Secretary|Spokesperson|Ambassador|Commissioner|Chairman|Chairwoman|CEO|CFO|CTO|Speaker|Leader|Deputy|Vice President|White House[^,]*?)\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
+
+
 def fix_repeated_subject(new_detail: str, existing_fact: str) -> str:
     """Replace repeated subject with pronoun for natural flow.
 
@@ -4610,12 +5829,8 @@ def fix_repeated_subject(new_detail: str, existing_fact: str) -> str:
     if not new_detail or not existing_fact:
         return new_detail
 
-    # Pattern to extract title + name at start of sentence
-    # Matches: "Title Name Name" or just "Name Name"
-    title_pattern = r'^((?:President|Secretary of State|Senator|Representative|Governor|Minister|Prime Minister|Chancellor|Director|Chief|General|Admiral|Mayor|Attorney General|Press Secretary|Spokesperson|Ambassador|Commissioner|Chairman|Chairwoman|CEO|CFO|CTO|Speaker|Leader|Deputy|Vice President|White House[^,]*?)\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
-
     # Extract subject from existing fact
-    existing_match = re.match(title_pattern, existing_fact)
+    existing_match = _SUBJECT_TITLE_RE.match(existing_fact)
     if not existing_match:
         return new_detail
 
@@ -4624,7 +5839,7 @@ def fix_repeated_subject(new_detail: str, existing_fact: str) -> str:
     existing_subject = (existing_title + existing_name).strip()
 
     # Check if new_detail starts with the same or similar subject
-    new_match = re.match(title_pattern, new_detail)
+    new_match = _SUBJECT_TITLE_RE.match(new_detail)
     if not new_match:
         return new_detail
 
@@ -4648,7 +5863,7 @@ def fix_repeated_subject(new_detail: str, existing_fact: str) -> str:
         pronoun = "They"
 
     # Replace the subject with the pronoun
-    fixed_detail = re.sub(f'^{re.escape(new_subject)}\\s*', f'{pronoun} ', new_detail)
+    fixed_detail = f"{pronoun} " + new_detail[new_match.end():].lstrip()
 
     log.debug(f"Fixed repeated subject: '{new_subject}' -> '{pronoun}'")
     return fixed_detail
@@ -4681,7 +5896,7 @@ If there is NO new information, return exactly: NO_NEW_INFO
 Return JSON: {{"new_detail": "the new sentence" or "NO_NEW_INFO"}}"""
 
     try:
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=100,
@@ -4720,13 +5935,14 @@ def update_published_story(story_index: int, additional_detail: str, new_source:
     stories_file = DATA_DIR / "stories.json"
 
     try:
-        with open(stories_file) as f:
-            data = json.load(f)
-
-        if story_index >= len(data.get("stories", [])):
+        # Usually already parsed by find_matching_published_story; copy the
+        # parts we change so the cached parse is untouched until saved
+        data = cached_load(stories_file, _read_json)
+        if not data or story_index >= len(data.get("stories", [])):
             return False
 
-        story = data["stories"][story_index]
+        data = {**data, "stories": list(data["stories"])}
+        story = data["stories"][story_index] = dict(data["stories"][story_index])
         old_fact = story["fact"]
 
         # Append new detail as separate sentence
@@ -4743,12 +5959,12 @@ def update_published_story(story_index: int, additional_detail: str, new_source:
         new_audio_file = generate_tts(updated_fact, story_id=new_audio_id)
 
         if new_audio_file:
-            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            today = utc_today()
             story["audio"] = f"../audio/archive/{today}/{new_audio_file}"
 
         # Write back
-        with open(stories_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(stories_file, data)
+        cache_store(stories_file, data)
 
         log.info(f"UPDATED story: +'{additional_detail}' from {new_source['source_name']}")
         return True
@@ -4762,10 +5978,12 @@ def update_published_story(story_index: int, additional_detail: str, new_source:
 # CLEANUP
 # =============================================================================
 
+# YYYY-MM-DD anywhere in a file name (2026-02-11.txt, fact_cache_2026-02-11.json)
+_DATED_FILE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+
 def cleanup_old_data(days: int = 7):
     """Delete raw data files and old videos older than N days."""
-    import glob
-    from datetime import timedelta
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     cutoff_str = cutoff.strftime("%Y-%m-%d")
@@ -4773,26 +5991,21 @@ def cleanup_old_data(days: int = 7):
     deleted = 0
 
     # Find dated files in data directory
-    for pattern in ["*.txt", "*.json"]:
+    for pattern in ["*.txt", "*.json", "*.jsonl"]:
         for filepath in DATA_DIR.glob(pattern):
             filename = filepath.name
 
-            # Skip non-dated files and config files
-            if not any(c.isdigit() for c in filename):
-                continue
-            if filename == "digest-config.json":
+            # Skip non-dated files (config, queue, ...)
+            match = _DATED_FILE_RE.search(filename)
+            if not match:
                 continue
 
-            # Extract date from filename (e.g., 2026-02-11.txt, processed_2026-02-11.txt)
+            # Delete if the date in the filename is before the cutoff
             try:
-                # Find date pattern in filename
-                match = re.search(r'(\d{4}-\d{2}-\d{2})', filename)
-                if match:
-                    file_date = match.group(1)
-                    if file_date < cutoff_str:
-                        filepath.unlink()
-                        deleted += 1
-                        log.info(f"Deleted old file: {filename}")
+                if match.group(1) < cutoff_str:
+                    filepath.unlink()
+                    deleted += 1
+                    log.info(f"Deleted old file: {filename}")
             except Exception as e:
                 log.error(f"Error checking file {filename}: {e}")
 
@@ -4801,7 +6014,7 @@ def cleanup_old_data(days: int = 7):
         for filepath in VIDEO_DIR.glob("*.mp4"):
             filename = filepath.name
             try:
-                match = re.search(r'(\d{4}-\d{2}-\d{2})', filename)
+                match = _DATED_FILE_RE.search(filename)
                 if match:
                     file_date = match.group(1)
                     if file_date < cutoff_str:
@@ -4815,7 +6028,7 @@ def cleanup_old_data(days: int = 7):
     audio_archive_dir = AUDIO_DIR / "archive"
     if audio_archive_dir.exists():
         for date_dir in audio_archive_dir.iterdir():
-            if date_dir.is_dir() and re.match(r'\d{4}-\d{2}-\d{2}', date_dir.name):
+            if date_dir.is_dir() and _DATED_FILE_RE.match(date_dir.name):
                 if date_dir.name < cutoff_str:
                     try:
                         shutil.rmtree(date_dir)
@@ -4926,7 +6139,6 @@ def get_seasonal_backgrounds(count: int = 50) -> list:
     Returns:
         List of image paths, shuffled for variety
     """
-    import random
 
     season = get_current_season()
     season_dir = BASE_DIR / "media" / season
@@ -5291,8 +6503,6 @@ def obs_stop_recording(ws) -> str:
     """
     try:
         from obswebsocket import requests as obs_requests
-        import glob
-        import subprocess
 
         # v4 protocol: Get recording folder first
         folder_response = ws.call(obs_requests.GetRecordingFolder())
@@ -5801,8 +7011,6 @@ def trim_video_silence(video_path: str) -> bool:
     Returns:
         True if processing succeeded, False otherwise
     """
-    import subprocess
-    import re
 
     video_path = Path(video_path)
     if not video_path.exists():
@@ -6034,7 +7242,6 @@ def _upload_video_to_youtube(video_path: str, date: str):
 
 def convert_video_to_podcast_audio(video_path: str, output_path: str) -> bool:
     """Convert MP4 to 320kbps MP3 using ffmpeg."""
-    import subprocess
     cmd = [
         'ffmpeg', '-i', video_path,
         '-vn',              # No video
@@ -6078,11 +7285,9 @@ def upload_to_archive_org(date: str, mp3_path: str, mp4_path: str) -> dict:
         thumbnail_src = BASE_DIR / "web" / "assets" / "png" / "thumbnail-youtube-1280x720.png"
         thumb_temp = None
         if thumbnail_src.exists():
-            import shutil
             thumb_temp = Path(mp3_path).parent / "__ia_thumb.jpg"
             # Convert PNG to JPEG for Archive.org compatibility
             try:
-                import subprocess
                 subprocess.run([
                     'sips', '-s', 'format', 'jpeg',
                     str(thumbnail_src), '--out', str(thumb_temp)
@@ -6144,8 +7349,6 @@ def update_podcast_feeds(date: str, archive_result: dict, story_count: int, dura
         duration_seconds: episode duration
         facts: list of fact strings to include in episode description
     """
-    from email.utils import formatdate
-    from xml.sax.saxutils import escape
 
     docs_dir = BASE_DIR / "docs"
     feed_path = docs_dir / "podcast.xml"
@@ -6373,12 +7576,11 @@ def get_queue_stats() -> dict:
 def get_stories_today_count() -> int:
     """Count stories published today."""
     stories_file = DATA_DIR / "stories.json"
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
 
     if stories_file.exists():
         try:
-            with open(stories_file) as f:
-                data = json.load(f)
+            data = _read_json(stories_file)
             if data.get("date") == today:
                 return len(data.get("stories", []))
         except:
@@ -6413,7 +7615,7 @@ def get_feedback_monitor_stats() -> dict:
         with open(stats_file) as f:
             stats = json.load(f)
 
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        today = utc_today()
         today_stats = stats.get("daily", {}).get(today, {})
         totals = stats.get("totals", {})
 
@@ -6603,7 +7805,6 @@ def push_to_ghpages(files: list, commit_message: str):
     Returns:
         True if successful, False otherwise
     """
-    import base64
 
     github_token = os.getenv("GITHUB_TOKEN")
     if not github_token:
@@ -6638,10 +7839,11 @@ def push_to_ghpages(files: list, commit_message: str):
             local_path = Path(local_path)
             if local_path.suffix == '.gz':
                 with open(local_path, "rb") as f:
-                    content = base64.b64encode(f.read()).decode()
+                    data = f.read()
             else:
                 with open(local_path, "r") as f:
-                    content = base64.b64encode(f.read().encode()).decode()
+                    data = f.read().encode()
+            content = base64.b64encode(data).decode()
 
             api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{gh_path}"
 
@@ -6649,6 +7851,10 @@ def push_to_ghpages(files: list, commit_message: str):
             response = requests.get(api_url, headers=headers, params={"ref": branch})
             sha = response.json().get("sha") if response.status_code == 200 else None
 
+            # Unchanged on GitHub (same git blob SHA)? Skip the empty commit.
+            if sha and sha == hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest():
+                continue
+
             # Push the update
             payload = {
                 "message": commit_message,
@@ -6734,15 +7940,12 @@ def mark_corrected_stories_in_log(log_file: Path, date_str: str):
 
 def archive_daily_log():
     """Archive yesterday's log to GitHub."""
-    import subprocess
 
-    yesterday = (datetime.now(timezone.utc).date() -
-                 __import__('datetime').timedelta(days=1))
+    yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
     yesterday_str = yesterday.strftime("%Y-%m-%d")
     year = yesterday.strftime("%Y")
 
     log_file = DATA_DIR / f"{yesterday_str}.txt"
-    hash_file = DATA_DIR / f"shown_{yesterday_str}.txt"
 
     if not log_file.exists():
         log.info("No log to archive")
@@ -6761,25 +7964,27 @@ def archive_daily_log():
     archive_dir = docs_dir / "archive" / year
     archive_dir.mkdir(parents=True, exist_ok=True)
 
-    # Gzip the log
+    # Gzip the log (skipped if a previous run got this far before stopping)
     archive_file = archive_dir / f"{yesterday_str}.txt.gz"
-    with open(log_file, 'rb') as f_in:
-        with gzip.open(archive_file, 'wb') as f_out:
-            shutil.copyfileobj(f_in, f_out)
-
-    log.info(f"Archived: {archive_file}")
+    if archive_file.exists():
+        log.info(f"Archive already exists: {archive_file}")
+    else:
+        tmp_file = archive_file.with_name(archive_file.name + ".tmp")
+        with open(log_file, 'rb') as f_in:
+            with gzip.open(tmp_file, 'wb', compresslevel=6) as f_out:
+                shutil.copyfileobj(f_in, f_out, length=1 << 20)
+        os.replace(tmp_file, archive_file)
+        log.info(f"Archived: {archive_file}")
 
     # Clean up old local files
     log_file.unlink(missing_ok=True)
-    hash_file.unlink(missing_ok=True)
 
-    # Clean up processed headlines cache
-    processed_file = DATA_DIR / f"processed_{yesterday_str}.txt"
-    processed_file.unlink(missing_ok=True)
+    # Clean up shown and processed headline hashes
+    clear_seen_hashes(yesterday_str)
 
     # Clean up fact extraction cache
-    fact_cache_file = DATA_DIR / f"fact_cache_{yesterday_str}.json"
-    fact_cache_file.unlink(missing_ok=True)
+    flush_fact_cache()
+    _fact_cache_file(yesterday_str).unlink(missing_ok=True)
 
     # Push to GitHub via API
     push_to_ghpages(
@@ -6900,6 +8105,52 @@ def update_search_index(dates: list = None):
 # MAIN LOOP
 # =============================================================================
 
+EXTRACT_WORKERS = 5  # Concurrent headline extractions per cycle
+
+
+def prepare_headline_fact(headline: dict) -> tuple | None:
+    """Extract, judge-enhance and screen the fact for one headline.
+
+    Runs on worker threads: touches only thread-safe caches, never the
+    queue or published state.
+
+    Returns (fact, confidence), or None if the headline should be dropped.
+    """
+    result = extract_fact(headline["text"])
+
+    # Skip if not a fact
+    if result["fact"] == "SKIP":
+        if result.get("newsworthy") is False:
+            log.info(f"Not newsworthy: {headline['text'][:40]}...")
+        return None
+
+    fact = result["fact"]
+    confidence = result["confidence"]
+
+    # Check confidence threshold
+    if confidence < CONFIG["thresholds"]["min_confidence"]:
+        log.info(f"Low confidence ({confidence}%): {fact[:40]}...")
+        return None
+
+    # Check newsworthiness threshold
+    newsworthy = result.get("newsworthy", True)  # Default to True for backwards compatibility
+    threshold_met = result.get("threshold_met", "unknown")
+    if not newsworthy:
+        log.info(f"Not newsworthy ({threshold_met}): {fact[:40]}...")
+        return None
+
+    # JUDGE LOOKUP: If fact mentions a judge without full details, try to look them up
+    # (only for facts that passed the checks above, so rejected ones cost nothing extra)
+    if needs_judge_lookup(fact):
+        log.info(f"Looking up judge info for: {fact[:50]}...")
+        judge_info = search_judge_info(fact, headline["text"])
+        if judge_info:
+            fact = enhance_fact_with_judge(fact, judge_info)
+            log.info(f"Enhanced with judge: {fact[:60]}...")
+
+    return fact, confidence
+
+
 def process_cycle():
     """Run one processing cycle."""
     cycle_start = time.time()
@@ -6926,8 +8177,7 @@ def process_cycle():
 
     # Load caches (saves API costs by avoiding redundant calls)
     processed_cache = load_processed_headlines()
-    global _fact_extraction_cache
-    _fact_extraction_cache = load_fact_extraction_cache()
+    load_fact_extraction_cache()
     skipped_count = 0
     published_count = 0
     processed_count = 0  # Headlines sent to Claude
@@ -6968,7 +8218,8 @@ def process_cycle():
             mark_submission_processed(sub, processed_fact="SKIP", confidence=0)
             continue
 
-        result = extract_fact(event_text)
+        # Full answer even when not newsworthy: bias scoring needs the fact
+        result = extract_fact(event_text, keep_rejected=True)
         processed_count += 1
 
         if result["fact"] == "SKIP":
@@ -7107,6 +8358,9 @@ def process_cycle():
     # Process community feedback
     process_pending_feedback()
 
+    # Extract facts in parallel (each headline is independent API work);
+    # queue matching and publishing stay serial below
+    to_extract = []
     for headline in headlines:
         # Skip if already processed (saves API costs)
         if is_headline_processed(headline["text"], processed_cache):
@@ -7115,45 +8369,36 @@ def process_cycle():
 
         # Mark as processed before calling API
         add_processed_headline(get_story_hash(headline["text"]))
+        to_extract.append(headline)
 
-        # Extract fact
-        result = extract_fact(headline["text"])
-        processed_count += 1  # Count headlines sent to Claude
-
-        # Skip if not a fact
-        if result["fact"] == "SKIP":
-            continue
-
-        fact = result["fact"]
-        confidence = result["confidence"]
+    processed_count += len(to_extract)  # Count headlines sent to Claude
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+        extracted = list(pool.map(prepare_headline_fact, to_extract))
 
-        # JUDGE LOOKUP: If fact mentions a judge without full details, try to look them up
-        if needs_judge_lookup(fact):
-            log.info(f"Looking up judge info for: {fact[:50]}...")
-            judge_info = search_judge_info(fact, headline["text"])
-            if judge_info:
-                fact = enhance_fact_with_judge(fact, judge_info)
-                log.info(f"Enhanced with judge: {fact[:60]}...")
+    pending = [(headline, *fc) for headline, fc in zip(to_extract, extracted) if fc]  # (headline, fact, confidence)
 
-        # Check confidence threshold
-        if confidence < CONFIG["thresholds"]["min_confidence"]:
-            log.info(f"Low confidence ({confidence}%): {fact[:40]}...")
-            continue
+    # The snapshot list keeps its items alive, so their ids can't be reused
+    # by stories queued later in the cycle
+    queue_snapshot = list(queue)
+    queue_snapshot_ids = {id(q) for q in queue_snapshot}
 
-        # Check newsworthiness threshold
-        newsworthy = result.get("newsworthy", True)  # Default to True for backwards compatibility
-        threshold_met = result.get("threshold_met", "unknown")
-        if not newsworthy:
-            log.info(f"Not newsworthy ({threshold_met}): {fact[:40]}...")
-            continue
+    # Match every new fact against the queue in a single Claude call
+    batch_matches = find_matching_stories_multi([p[1] for p in pending], queue)
 
-        # Check for duplicates
+    for i, (headline, fact, confidence) in enumerate(pending):
+        # Check for duplicates (after extraction, so stories published
+        # earlier in this cycle are caught too)
         if is_duplicate(fact):
             log.info(f"Duplicate: {fact[:40]}...")
             continue
 
-        # Look for matching stories in queue
-        matches = find_matching_stories(fact, queue)
+        # Batched matches that are still queued, plus anything queued
+        # earlier this cycle (not part of the batch call)
+        live_ids = {id(q) for q in queue}
+        matches = [m for m in batch_matches.get(i, []) if id(m) in live_ids]
+        fresh = [q for q in queue if id(q) not in queue_snapshot_ids]
+        if fresh:
+            matches += find_matching_stories(fact, fresh)
 
         if matches:
             # Check if any match has unrelated source
@@ -7301,8 +8546,12 @@ def process_cycle():
             queued_count += 1
             log.info(f"Queued: {fact[:40]}...")
 
-    # Save queue
+    # Save queue and this cycle's ratings, processed-headline, fact-cache and usage updates
     save_queue(queue)
+    flush_ratings()
+    flush_processed_headlines()
+    flush_fact_cache()
+    flush_api_usage()
 
     # Calculate cycle duration and write monitor data
     cycle_duration = time.time() - cycle_start
@@ -7381,7 +8630,7 @@ Return ONLY valid JSON, no explanation or markdown."""
 def research_source_ownership(source: dict) -> dict:
     """Use Claude to research current ownership for a source."""
     try:
-        client = anthropic.Anthropic()
+        client = _get_anthropic()
 
         prompt = OWNERSHIP_RESEARCH_PROMPT.format(
             source_name=source.get("name", source.get("id")),
@@ -7408,11 +8657,13 @@ def research_source_ownership(source: dict) -> dict:
         start = text.find('{')
         end = text.rfind('}') + 1
         if start >= 0 and end > start:
-            return json.loads(text[start:end])
+            return _json_loads(text[start:end])
 
         return {"changed": False, "notes": "Failed to parse response"}
 
     except Exception as e:
+        if isinstance(e, anthropic.APIConnectionError):
+            _reset_anthropic()
         log.warning(f"Ownership research failed for {source.get('id')}: {e}")
         return {"changed": False, "notes": f"Research failed: {e}"}
 
@@ -7437,17 +8688,25 @@ def perform_ownership_audit() -> bool:
     # Skip government sources - ownership doesn't change
     skip_types = ["government"]
 
+    # Per-source lines are collected and logged once at the end
+    record_lines = []
+
+    todo = []
     for source in CONFIG["sources"]:
         source_id = source.get("id", "unknown")
-        control_type = source.get("control_type", "")
-
-        if control_type in skip_types:
-            log.info(f"  [SKIP] {source_id} (government source)")
+        if source.get("control_type", "") in skip_types:
+            record_lines.append(f"  [SKIP] {source_id} (government source)")
             verified.append(source_id)
-            continue
+        else:
+            todo.append(source)
+
+    # Research in parallel - each call is I/O bound, and the shared client
+    # retries 429s itself, so no sleep between requests is needed
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(research_source_ownership, todo))
 
-        log.info(f"  [RESEARCH] {source_id}...")
-        result = research_source_ownership(source)
+    for source, result in zip(todo, results):
+        source_id = source.get("id", "unknown")
 
         if result.get("changed", False):
             changes.append({
@@ -7465,13 +8724,13 @@ def perform_ownership_audit() -> bool:
                 },
                 "notes": result.get("notes", "")
             })
-            log.info(f"    → CHANGE DETECTED: {result.get('notes', 'See details')}")
+            record_lines.append(f"  [RESEARCH] {source_id} → CHANGE DETECTED: {result.get('notes', 'See details')}")
         else:
             verified.append(source_id)
-            log.info(f"    → Verified (no changes)")
+            record_lines.append(f"  [RESEARCH] {source_id} → Verified (no changes)")
 
-        # Small delay to avoid rate limiting
-        time.sleep(0.5)
+    if record_lines:
+        log.info("Audit per-source results:\n" + "\n".join(record_lines))
 
     log.info("")
     log.info("=" * 60)
@@ -7733,6 +8992,10 @@ def main():
     if _degraded_services:
         log.info(f"Starting in degraded mode: {_degraded_services}")
 
+    # Warm the robots.txt cache (refreshes itself in the background)
+    load_robots_cache()
+    prefetch_robots()
+
     while True:
         try:
             # Write heartbeat to indicate we're alive
@@ -7792,7 +9055,7 @@ def rebuild_stories_from_log():
     2. Hash-based lookup in archive folder
     3. Legacy index-based fallback
     """
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = utc_today()
     log_file = DATA_DIR / f"{today}.txt"
     stories_file = DATA_DIR / "stories.json"
 
@@ -7815,15 +9078,19 @@ def rebuild_stories_from_log():
 
     log.info(f"Found {len(legacy_audio)} legacy + {len(archived_audio)} archived audio files")
 
+    # Precompute display labels and default URLs once (not per log line)
+    name_to_label = {s["name"]: f"{s['name']} {get_compact_scores(s['id'])}" for s in CONFIG["sources"]}
+    name_to_url = {s["name"]: s.get("url", "") for s in CONFIG["sources"]}
+
     # Parse daily log
     stories = []
-    with open(log_file) as f:
-        for line in f:
-            # Skip headers and blank lines
-            if line.startswith("#") or not line.strip():
+    with open(log_file, 'rb', buffering=1 << 20) as f:
+        for raw in f:
+            # Skip headers and blank lines without decoding them
+            if raw.startswith(b"#") or b"|" not in raw:
                 continue
 
-            parts = line.strip().split("|")
+            parts = raw.decode("utf-8", "replace").strip().split("|")
             if len(parts) < 4:
                 continue
 
@@ -7848,30 +9115,18 @@ def rebuild_stories_from_log():
                 stored_audio = parts[4]
                 fact = "|".join(parts[5:])
 
-            # Split sources and look up IDs for current format
-            names = source_names.split(",")
+            # Split sources and format attribution from precomputed labels
+            names = [n.strip() for n in source_names.split(",")]
             urls = source_urls_str.split(",") if source_urls_str else []
 
-            # Format source attribution using current get_compact_scores()
-            source_parts = []
+            source_text = " · ".join(name_to_label.get(n, n) for n in names)
             source_urls_map = {}
             for i, name in enumerate(names):
-                name = name.strip()
-                source_id = None
                 source_url = urls[i].strip() if i < len(urls) else ""
-                for src in CONFIG["sources"]:
-                    if src["name"] == name:
-                        source_id = src["id"]
-                        if not source_url:
-                            source_url = src.get("url", "")
-                        break
-                if source_id:
-                    source_parts.append(f"{name} {get_compact_scores(source_id)}")
-                else:
-                    source_parts.append(name)
+                if not source_url:
+                    source_url = name_to_url.get(name, "")
                 if source_url:
                     source_urls_map[name] = source_url
-            source_text = " · ".join(source_parts)
 
             # Find audio file - priority: stored, hash-based, legacy index
             audio_filename = None
@@ -7923,8 +9178,7 @@ def rebuild_stories_from_log():
 
     # Write rebuilt stories.json
     data = {"date": today, "stories": stories}
-    with open(stories_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_json(stories_file, data)
 
     log.info(f"Rebuilt stories.json: {len(stories)} stories (from {log_file.name})")
     return True
@@ -7943,7 +9197,6 @@ def regenerate_audio_for_date(date: str, force: bool = False) -> dict:
     Returns:
         Dict with 'generated', 'skipped', 'failed' counts
     """
-    import gzip
 
     log.info(f"=== Regenerating audio for {date} ===")
 
@@ -8011,7 +9264,7 @@ def regenerate_audio_for_date(date: str, force: bool = False) -> dict:
         # (Don't use generate_tts() as it writes to TODAY's folder)
         log.info(f"  Story {story_index}: Generating audio for: {fact[:50]}...")
         try:
-            client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+            client = _get_elevenlabs()
 
             audio_generator = client.text_to_speech.convert(
                 voice_id=os.getenv("ELEVENLABS_VOICE_ID"),
@@ -8072,7 +9325,6 @@ def rebuild_archives_with_urls():
     Converts old format (timestamp|names|scores|fact) to
     new format (timestamp|names|scores|urls|fact).
     """
-    import gzip
 
     docs_dir = BASE_DIR / "docs"
     archive_dir = docs_dir / "archive"
@@ -8162,8 +9414,7 @@ def rebuild_archives_with_urls():
 
 def rebuild_feed_with_urls():
     """Rebuild feed.xml to include source URLs in all items."""
-    JTF_NS = "https://jtfnews.com/rss"
-    ATOM_NS = "http://www.w3.org/2005/Atom"
+    JTF_NS = RSS_JTF_NS
 
     docs_dir = BASE_DIR / "docs"
     feed_file = docs_dir / "feed.xml"
@@ -8201,7 +9452,6 @@ def rebuild_feed_with_urls():
         indent_xml(root, space="  ")
         with open(feed_file, 'wb') as f:
             tree.write(f, encoding="utf-8", xml_declaration=True)
-        clean_duplicate_namespaces(feed_file)
 
         log.info(f"Updated feed.xml: {items_updated} source elements updated")
         return True
@@ -8220,8 +9470,7 @@ def rebuild_stories_json_with_urls():
         return False
 
     try:
-        with open(stories_file) as f:
-            data = json.load(f)
+        data = _read_json(stories_file)
 
         stories_updated = 0
         for story in data.get("stories", []):
@@ -8251,13 +9500,11 @@ def rebuild_stories_json_with_urls():
                     stories_updated += 1
 
         # Write back
-        with open(stories_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(stories_file, data)
 
         # Also copy to docs
         docs_dir = BASE_DIR / "docs"
         if docs_dir.exists():
-            import shutil
             shutil.copy(stories_file, docs_dir / "stories.json")
 
         log.info(f"Updated stories.json: {stories_updated} stories updated")
@@ -0,0 +1,461 @@
+"""Behavior tests for main.py helpers.
+
+Run with:  python -m pytest test_main.py
+
+Every test points main's data paths at a temporary directory, and
+conftest.py keeps log records out of jtf.log, so nothing touches the
+real data/, docs/ or audio/ folders or the log.
+"""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import main
+
+
+def utc_today() -> str:
+    """Today's UTC date as main names its daily files."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def tmp_dirs(tmp_path, monkeypatch):
+    """Redirect BASE_DIR / DATA_DIR / AUDIO_DIR to a scratch directory."""
+    data_dir = tmp_path / "data"
+    audio_dir = tmp_path / "audio"
+    docs_dir = tmp_path / "docs"
+    for d in (data_dir, audio_dir, docs_dir):
+        d.mkdir()
+    monkeypatch.setattr(main, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(main, "DATA_DIR", data_dir)
+    monkeypatch.setattr(main, "AUDIO_DIR", audio_dir)
+    return tmp_path
+
+
+# =============================================================================
+# STORY HASHES
+# =============================================================================
+
+def test_story_hash_stays_compatible_with_stored_md5_hashes():
+    # Persisted hashes (dedup store, caches, audio files) were written as
+    # the first 12 hex chars of MD5 over the lowercased text
+    text = "Officials Confirmed The Bridge Reopened On Tuesday."
+    assert main.get_story_hash(text) == "093eb0f631c7"
+    assert main.get_story_hash(text) == main.get_story_hash(text.lower())
+    assert main.get_story_audio_id(text) == main.get_story_hash(text)
+
+
+# =============================================================================
+# DEDUP STORE
+# =============================================================================
+
+@pytest.fixture
+def dedup_db(tmp_dirs, monkeypatch):
+    """Fresh dedup database under the scratch data directory."""
+    monkeypatch.setattr(main, "DEDUP_DB_FILE", tmp_dirs / "data" / "dedup.sqlite")
+    monkeypatch.setattr(main, "_dedup_db", None)
+    monkeypatch.setattr(main, "_shown_date", None)
+    monkeypatch.setattr(main, "_processed_date", None)
+    monkeypatch.setattr(main, "_processed_pending", [])
+    yield tmp_dirs / "data"
+    if main._dedup_db is not None:
+        main._dedup_db.close()
+
+
+def test_dedup_store_imports_legacy_hash_files(dedup_db):
+    today = utc_today()
+    (dedup_db / f"shown_{today}.txt").write_text("aaa111\nbbb222\n\n")
+    (dedup_db / f"processed_{today}.txt").write_text("ccc333\n")
+    (dedup_db / "processed_2026-01-01.txt").write_text("old999\n")
+
+    assert main.load_shown_hashes() == {"aaa111", "bbb222"}
+    assert main.load_processed_headlines() == {"ccc333"}
+    assert main.load_seen_hashes("shown") == {"aaa111", "bbb222"}
+    assert list(dedup_db.glob("*.txt")) == []  # Imported files are removed
+
+    # Older days are kept under their own date
+    rows = main._get_dedup_db().execute(
+        "SELECT hash FROM seen WHERE date = '2026-01-01' AND kind = 'processed'"
+    ).fetchall()
+    assert rows == [("old999",)]
+
+
+def test_processed_headlines_are_a_per_cycle_snapshot(dedup_db):
+    # A headline marked mid-cycle stays unprocessed for the rest of that
+    # cycle, so another source carrying the same text can corroborate it
+    cycle_cache = main.load_processed_headlines()
+    main.add_processed_headline("fff666")
+    assert "fff666" not in cycle_cache
+    assert "fff666" in main.load_processed_headlines()
+
+
+def test_shown_hashes_stay_in_sync_with_store(dedup_db):
+    main.add_shown_hash("ddd444")
+    assert "ddd444" in main.load_shown_hashes()
+    main.add_shown_hash("eee555")
+    assert main.load_shown_hashes() == {"ddd444", "eee555"}
+    assert main.load_seen_hashes("shown") == {"ddd444", "eee555"}
+
+
+# =============================================================================
+# JUDGE LOOKUP
+# =============================================================================
+
+JUDGE = {"full_name": "Jane Roe", "court": "U.S. District Court for the District of Columbia"}
+JUDGE_REF = "Judge Jane Roe of the U.S. District Court for the District of Columbia"
+
+
+def test_enhance_fact_with_judge_replaces_in_pattern_priority_order():
+    # "A federal judge" outranks an earlier "Judge Smith" reference
+    fact = "Judge Smith's ruling was upheld by a federal judge on Monday."
+    assert main.enhance_fact_with_judge(fact, JUDGE) == (
+        f"Judge Smith's ruling was upheld by {JUDGE_REF} on Monday."
+    )
+
+
+def test_enhance_fact_with_judge_keeps_court_names_literal():
+    info = {"full_name": "Ann Lee", "court": r"Court \1 of Appeals"}
+    assert main.enhance_fact_with_judge("The judge ruled.", info) == (
+        r"Judge Ann Lee of the Court \1 of Appeals ruled."
+    )
+    assert main.enhance_fact_with_judge("Nothing to see.", JUDGE) == "Nothing to see."
+
+
+# =============================================================================
+# RSS STRING WRITER
+# =============================================================================
+
+TRICKY_VALUES = [
+    "plain",
+    "AT&T <Inc> \"quoted\" 'single'",
+    "line\nbreak\tand\rreturn",
+    "already &amp; escaped",
+    "émoji ✓ and ünïcode",
+]
+
+
+@pytest.mark.parametrize("value", TRICKY_VALUES)
+def test_rss_escaping_matches_elementtree(value):
+    assert main._xml_text(value) == ET._escape_cdata(value)
+    assert main._xml_attr(value) == f'"{ET._escape_attrib(value)}"'
+
+
+def test_update_rss_feed_output_parses_and_round_trips(tmp_dirs, monkeypatch):
+    monkeypatch.setattr(main, "FEED_ITEMS_FILE", tmp_dirs / "data" / "feed_items.json")
+    tricky = TRICKY_VALUES[1]
+    monkeypatch.setattr(main, "get_source_for_rss", lambda source_id: {
+        "name": tricky, "url": "https://example.com/?a=1&b=2",
+        "accuracy": "9.4", "bias": "8.0", "speed": "5.0", "consensus": "5.0",
+        "control_type": "public", "owners": [{"name": "Owner \"A\" & Co", "percent": "51.0"}],
+    })
+    fact = "Prices rose 5% & wages <fell> in \"Q1\"."
+
+    feed_file = main.update_rss_feed(fact, [{"source_id": "x"}])
+    main.update_rss_feed("Second fact.", [])  # Re-reads the first item from the sidecar
+
+    root = ET.parse(feed_file).getroot()
+    items = root.findall("channel/item")
+    assert [i.findtext("description") for i in items] == ["Second fact.", fact]
+    source = items[1].find(f"{{{main.RSS_JTF_NS}}}source")
+    assert source.get("name") == tricky
+    assert source.get("url") == "https://example.com/?a=1&b=2"
+    assert source.find(f"{{{main.RSS_JTF_NS}}}owner").get("name") == "Owner \"A\" & Co"
+
+    # Parsing the XML back (no sidecar) yields the same items
+    assert main._parse_rss_items(feed_file, main.RSS_JTF_NS)[1]["sources"][0]["name"] == tricky
+
+
+# =============================================================================
+# DAILY LOG
+# =============================================================================
+
+def test_get_recent_facts_reads_fact_field_of_every_log_format(tmp_dirs):
+    log_file = tmp_dirs / "data" / f"{utc_today()}.txt"
+    log_file.write_text(
+        "# JTF News Daily Log\n\n"
+        "2026-02-20T10:00:00|BBC,NPR|9.5*|Four-field fact.\n"
+        "2026-02-20T11:00:00|BBC,NPR|9.5*|https://a,https://b|Five-field fact.\n"
+        "2026-02-20T12:00:00|BBC,NPR|9.5*|https://a,https://b|audio_1.mp3|Six-field fact.\n"
+        "2026-02-20T13:00:00|BBC,NPR|9.5*|https://a,https://b|audio_2.mp3|Vote split 52|48 on the bill.\n"
+    )
+    assert main.get_recent_facts() == [
+        "Four-field fact.",
+        "Five-field fact.",
+        "Six-field fact.",
+        "Vote split 52|48 on the bill.",
+    ]
+
+
+# =============================================================================
+# API USAGE
+# =============================================================================
+
+@pytest.fixture
+def api_usage(tmp_dirs, monkeypatch):
+    """No pending usage and no timed flush during the test."""
+    monkeypatch.setattr(main, "_api_usage_pending", {})
+    monkeypatch.setattr(main, "_api_usage_flushed", float("inf"))
+    return tmp_dirs / "data" / f"api_usage_{utc_today()}.json"
+
+
+def test_api_usage_flush_merges_with_other_processes(api_usage):
+    main.log_api_usage("elevenlabs", {"characters": 100})
+
+    # Another process (e.g. the digest) wrote its own totals meanwhile
+    api_usage.write_text(json.dumps({
+        "date": utc_today(),
+        "services": {"elevenlabs": {"calls": 2, "cost_usd": 0.5, "details": {"characters": 300}},
+                     "twilio": {"calls": 1, "cost_usd": 0.01, "details": {"sms_count": 1}}},
+        "total_cost_usd": 0.51,
+    }))
+    assert main.get_api_costs_today()["services"]["elevenlabs"]["calls"] == 3
+
+    main.flush_api_usage()
+    main.flush_api_usage()  # Nothing pending: must not add the delta twice
+
+    data = json.loads(api_usage.read_text())
+    assert data["services"]["elevenlabs"]["calls"] == 3
+    assert data["services"]["elevenlabs"]["details"]["characters"] == 400
+    assert data["services"]["twilio"]["calls"] == 1
+    assert data["total_cost_usd"] == pytest.approx(
+        sum(s["cost_usd"] for s in data["services"].values()))
+
+
+# =============================================================================
+# FACT EXTRACTION CACHE
+# =============================================================================
+
+@pytest.fixture
+def fact_cache(tmp_dirs, monkeypatch):
+    """Empty fact cache capped at three entries."""
+    monkeypatch.setattr(main, "FACT_CACHE_MAX", 3)
+    monkeypatch.setattr(main, "_fact_extraction_cache", main.OrderedDict())
+    monkeypatch.setattr(main, "_fact_cache_date", None)
+    monkeypatch.setattr(main, "_fact_cache_pending", [])
+    main.load_fact_extraction_cache()
+    return tmp_dirs / "data"
+
+
+def test_fact_cache_evicts_least_recently_used(fact_cache):
+    for h in ("h1", "h2", "h3"):
+        main.save_fact_extraction(h, {"fact": h})
+    assert main.lookup_fact_extraction("h1") == {"fact": "h1"}  # h1 is now most recent
+
+    main.save_fact_extraction("h4", {"fact": "h4"})
+
+    assert main.lookup_fact_extraction("h2") is None
+    assert [main.lookup_fact_extraction(h) for h in ("h1", "h3", "h4")] == [
+        {"fact": "h1"}, {"fact": "h3"}, {"fact": "h4"},
+    ]
+
+
+def test_fact_cache_reload_keeps_newest_entries(fact_cache, monkeypatch):
+    for i in range(5):
+        main.save_fact_extraction(f"h{i}", {"fact": str(i)})
+    main.flush_fact_cache()
+
+    monkeypatch.setattr(main, "_fact_cache_date", None)
+    cache = main.load_fact_extraction_cache()
+    assert list(cache) == ["h2", "h3", "h4"]
+
+
+# =============================================================================
+# FACT EXTRACTION
+# =============================================================================
+
+class FakeClaude:
+    """Stands in for the Anthropic client; returns a canned reply."""
+
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.prompts = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.prompts.append(kwargs["messages"][0]["content"])
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=self.reply)],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+
+
+@pytest.fixture
+def claude_reply(monkeypatch):
+    """Install a FakeClaude and capture save_fact_extraction calls."""
+    saved = []
+    monkeypatch.setattr(main, "log_api_usage", lambda *a, **k: None)
+    monkeypatch.setattr(main, "save_fact_extraction", lambda h, r: saved.append((h, r)))
+
+    def install(reply: str) -> FakeClaude:
+        fake = FakeClaude(reply)
+        monkeypatch.setattr(main, "_get_anthropic", lambda: fake)
+        return fake
+
+    install.saved = saved
+    return install
+
+
+def test_extract_fact_short_circuits_not_newsworthy(claude_reply):
+    fake = claude_reply('{"newsworthy": false, "threshold_met": "none", "fact": "SKIP", "confidence": 0}')
+    result = main.extract_fact("Celebrity shares holiday recipes", use_cache=False)
+    assert result["fact"] == "SKIP" and result["newsworthy"] is False
+    assert 'If "newsworthy" is false, stop there' in fake.prompts[0]
+    assert claude_reply.saved == []
+
+
+def test_extract_fact_keep_rejected_returns_full_answer(claude_reply):
+    fake = claude_reply('{"fact": "A cafe opened.", "confidence": 95, "newsworthy": false}')
+    result = main.extract_fact("Charming cafe opens", use_cache=False, keep_rejected=True)
+    assert result["fact"] == "A cafe opened." and result["newsworthy"] is False
+    assert 'stop there' not in fake.prompts[0]
+    assert claude_reply.saved == []
+
+
+def test_extract_fact_caches_accepted_facts(claude_reply):
+    claude_reply('{"fact": "The bridge reopened.", "confidence": 95, "newsworthy": true}')
+    result = main.extract_fact("Bridge finally reopens", use_cache=False)
+    assert result["fact"] == "The bridge reopened."
+    assert claude_reply.saved == [(main.get_story_hash("Bridge finally reopens"), result)]
+
+
+def test_extract_fact_regex_fallback_does_not_cache_skip(claude_reply):
+    # Malformed JSON (trailing comma) goes through the regex fallback
+    claude_reply('{"fact": "SKIP", "confidence": 0,}')
+    result = main.extract_fact("Opinion: why we are right", use_cache=False)
+    assert result["fact"] == "SKIP"
+    assert claude_reply.saved == []
+
+
+# =============================================================================
+# ALERTS
+# =============================================================================
+
+def test_drain_alerts_sends_queued_alerts_once(monkeypatch):
+    sent = []
+    monkeypatch.setattr(main, "send_alert", lambda message, alert_type: sent.append(message))
+    monkeypatch.setattr(main, "_alert_queue", main.SimpleQueue())
+    for message in ("claude API failed 3 times", "claude API failed 3 times", "twilio API failed 3 times"):
+        main._alert_queue.put((message, "api_failure"))
+
+    main.drain_alerts()
+
+    assert sent == ["claude API failed 3 times", "twilio API failed 3 times"]
+    assert main._alert_queue.empty()
+
+
+# =============================================================================
+# ROBOTS.TXT CACHE
+# =============================================================================
+
+@pytest.fixture
+def robots_cache(tmp_dirs, monkeypatch):
+    """Empty robots.txt cache saved under the scratch data directory."""
+    monkeypatch.setattr(main, "ROBOTS_CACHE_FILE", tmp_dirs / "data" / "robots_cache.json")
+    monkeypatch.setattr(main, "_robots_cache", {})
+    monkeypatch.setattr(main, "_robots_responses", {})
+    monkeypatch.setattr(main, "_robots_dirty", False)
+    return main.ROBOTS_CACHE_FILE
+
+
+def test_save_robots_cache_leaves_file_alone_without_fetches(robots_cache):
+    robots_cache.write_text('{"https://example.com": {"fetched_at": 1, "status": 200, "text": ""}}')
+    main.save_robots_cache()
+    assert json.loads(robots_cache.read_text()) == {
+        "https://example.com": {"fetched_at": 1, "status": 200, "text": ""},
+    }
+
+
+def test_robots_cache_round_trips_fetched_responses(robots_cache, monkeypatch):
+    response = SimpleNamespace(status_code=200, text="User-agent: *\nDisallow: /private\n")
+    monkeypatch.setattr(main, "_get_http_session",
+                        lambda: SimpleNamespace(get=lambda *a, **k: response))
+    main.fetch_robots("https://example.com")
+    main.save_robots_cache()
+
+    monkeypatch.setattr(main, "_robots_cache", {})
+    main.load_robots_cache()
+    parser = main._robots_cache["https://example.com"][0]
+    assert not parser.can_fetch(main.USER_AGENT, "https://example.com/private/page")
+    assert parser.can_fetch(main.USER_AGENT, "https://example.com/news")
+
+
+# =============================================================================
+# HTML SCRAPING
+# =============================================================================
+
+def test_bs4_parser_matches_lxml_availability():
+    import importlib.util
+    expected = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+    assert main.BS4_PARSER == expected
+
+
+# =============================================================================
+# RSS FEED
+# =============================================================================
+
+def test_regenerate_rss_feed_resolves_source_names(tmp_dirs):
+    source = main.CONFIG["sources"][0]
+    stories = {
+        "date": utc_today(),
+        "stories": [{
+            "fact": "Officials confirmed the bridge reopened on Tuesday.",
+            "source": f"{source['name']} 9.5*|9.0 · Unlisted Wire 5.0|5.0",
+            "published_at": "2026-02-20T12:00:00Z",
+            "hash": "abc123def456",
+        }],
+    }
+    (tmp_dirs / "docs" / "stories.json").write_text(json.dumps(stories))
+
+    assert main.regenerate_rss_feed() is True
+
+    root = ET.parse(tmp_dirs / "docs" / "feed.xml").getroot()
+    sources = root.findall(f"channel/item/{{{main.RSS_JTF_NS}}}source")
+    assert [s.get("name") for s in sources] == [source["name"], "Unlisted Wire"]
+    assert sources[1].get("control_type") == "unknown"
+
+
+def test_get_source_id_by_name_is_case_insensitive():
+    source = main.CONFIG["sources"][0]
+    assert main.get_source_id_by_name(f"  {source['name'].upper()} ") == source["id"]
+    assert main.get_source_id_by_name("No Such Source") == ""
+
+
+# =============================================================================
+# TEXT-TO-SPEECH
+# =============================================================================
+
+def fake_elevenlabs(chunks):
+    """Client whose convert() yields chunks; an Exception item is raised mid-stream."""
+    def convert(**kwargs):
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    return SimpleNamespace(text_to_speech=SimpleNamespace(convert=convert))
+
+
+def test_generate_tts_writes_archive_and_current(tmp_dirs, monkeypatch):
+    monkeypatch.setattr(main, "_get_elevenlabs", lambda: fake_elevenlabs([b"ab", b"cd"]))
+    monkeypatch.setattr(main, "log_api_usage", lambda *a, **k: None)
+
+    assert main.generate_tts("Hello", story_id="s1", archive_date="2026-02-20") == "s1.mp3"
+    audio_dir = tmp_dirs / "audio"
+    assert (audio_dir / "archive" / "2026-02-20" / "s1.mp3").read_bytes() == b"abcd"
+    assert (audio_dir / "current.mp3").read_bytes() == b"abcd"
+
+
+def test_generate_tts_removes_part_files_when_stream_fails(tmp_dirs, monkeypatch):
+    audio_dir = tmp_dirs / "audio"
+    (audio_dir / "current.mp3").write_bytes(b"previous")
+    monkeypatch.setattr(main, "_get_elevenlabs",
+                        lambda: fake_elevenlabs([b"ab", ConnectionError("stream dropped")]))
+    monkeypatch.setattr(main, "log_api_usage", lambda *a, **k: None)
+
+    assert main.generate_tts("Hello", story_id="s1", archive_date="2026-02-20") is False
+    assert list(audio_dir.rglob("*.part")) == []
+    assert not (audio_dir / "archive" / "2026-02-20" / "s1.mp3").exists()
+    assert (audio_dir / "current.mp3").read_bytes() == b"previous"